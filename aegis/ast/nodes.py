@@ -23,6 +23,8 @@ class ASTNode(ABC):
     to be performed on the tree structure.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def accept(self, visitor: 'ASTVisitor') -> Any:
         """
@@ -47,7 +49,7 @@ class ASTNode(ABC):
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class AssignmentNode(ASTNode):
     """
     Represents a variable assignment statement: identifier = expression
@@ -64,7 +66,7 @@ class AssignmentNode(ASTNode):
         return [self.expression]
 
 
-@dataclass
+@dataclass(slots=True)
 class BinaryOpNode(ASTNode):
     """
     Represents a binary arithmetic operation: left operator right
@@ -83,7 +85,7 @@ class BinaryOpNode(ASTNode):
         return [self.left, self.right]
 
 
-@dataclass
+@dataclass(slots=True)
 class IdentifierNode(ASTNode):
     """
     Represents a variable reference.
@@ -99,7 +101,7 @@ class IdentifierNode(ASTNode):
         return []
 
 
-@dataclass
+@dataclass(slots=True)
 class IntegerNode(ASTNode):
     """
     Represents an integer literal.
@@ -115,7 +117,7 @@ class IntegerNode(ASTNode):
         return []
 
 
-@dataclass
+@dataclass(slots=True)
 class PrintNode(ASTNode):
     """
     Represents a print statement: print identifier
@@ -35,7 +35,7 @@ class TokenType(Enum):
     NEWLINE = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     """
     Represents a single token in the AEGIS language.
@@ -84,7 +84,8 @@ class AegisExecutionPipeline:
         Initialize the AEGIS execution pipeline.
         
         Args:
-            trust_file: File path for trust data persistence
+            trust_file: File path for trust data persistence, or ":memory:"
+                to keep trust data in memory only
             cache_size: Maximum size of optimization cache
             violation_threshold: Instruction count limit for violation detection
             trust_threshold: Minimum trust score for optimization
@@ -174,123 +175,227 @@ class AegisExecutionPipeline:
             print(f"[AEGIS] Source code ({len(source_code)} chars)")
         
         try:
-            # 1. Lexical Analysis
-            if verbose:
-                print("[AEGIS] Phase 1: Lexical analysis...")
-            tokens = self.lexer.tokenize(source_code)
-            
-            # 2. Syntax Analysis
-            if verbose:
-                print("[AEGIS] Phase 2: Syntax analysis...")
-            ast = self.parser.parse(tokens)
+            ast, code_hash = self._analyze(source_code, verbose)
+            return self._execute_analyzed(ast, code_hash, start_time, verbose)
             
-            # 3. Static Security Analysis
-            if verbose:
-                print("[AEGIS] Phase 3: Static security analysis...")
-            analysis_passed = self.analyzer.analyze(ast)
-            if not analysis_passed:
-                raise AnalysisError("Static analysis failed")
-            
-            # 4. Execution Mode Determination
-            code_hash = self.trust_manager.get_code_hash(source_code)
-            trust_score_obj = self.trust_manager.get_trust_score(code_hash)
-            is_trusted = self.trust_manager.is_trusted_for_optimization(code_hash)
+        except (LexicalError, AegisSyntaxError, SemanticError, AegisRuntimeError) as e:
+            return self._failed_result(e, source_code, start_time, verbose)
+    
+    def execute_many(self, source_code: str, count: int, 
+                     verbose: bool = False) -> List[ExecutionResult]:
+        """
+        Execute the same program repeatedly, analyzing the source only once.
+        
+        Lexing, parsing, static analysis and code hashing run a single time;
+        each of the count executions still re-checks trust, so the mode can
+        move from sandboxed to optimized within the batch exactly as it
+        would across separate execute() calls. Each result's execution_time
+        covers only its own execution phases.
+        
+        Args:
+            source_code: The AEGIS source code to execute
+            count: Number of times to execute the program
+            verbose: Whether to print execution information
             
-            execution_mode = 'optimized' if is_trusted else 'sandboxed'
+        Returns:
+            List of count ExecutionResult objects, in execution order
             
-            if verbose:
-                print(f"[AEGIS] Phase 4: Execution mode determination...")
-                print(f"[AEGIS] Trust score: {trust_score_obj.current_score:.2f} ({trust_score_obj.get_trust_level()})")
-                print(f"[AEGIS] Execution mode: {execution_mode.upper()}")
+        Raises:
+            ValueError: If count is less than 1
+        """
+        if count < 1:
+            raise ValueError(f"count must be at least 1, got {count}")
+        
+        start_time = time.time()
+        
+        try:
+            ast, code_hash = self._analyze(source_code, verbose)
+        except (LexicalError, AegisSyntaxError, SemanticError, AegisRuntimeError) as e:
+            # Every execution would fail the same way before running; the
+            # error is only reported once
+            self.total_executions += count
+            return [self._failed_result(e, source_code, start_time, verbose and i == 0)
+                    for i in range(count)]
+        
+        results = []
+        for i in range(count):
+            run_start = time.time()
+            self.total_executions += 1
             
-            # 5. Program Execution
             if verbose:
-                print(f"[AEGIS] Phase 5: Program execution ({execution_mode})...")
-            
-            context = ExecutionContext()
-            violations = []
-            rollback_events = []
+                print(f"\n[AEGIS] Starting execution #{self.total_executions} "
+                      f"({i + 1}/{count})")
             
             try:
-                if execution_mode == 'sandboxed':
-                    # Sandboxed execution
-                    self.interpreter.execute(ast, context)
-                    # Get metrics from monitor history
-                    history = self.monitor.get_execution_history()
-                    metrics = history[-1] if history else ExecutionMetrics()
-                else:
-                    # Optimized execution
-                    self.optimized_executions += 1
-                    metrics = self.optimizer.execute_optimized(code_hash, ast, context)
-                
-            except SecurityViolation as e:
-                # Security violation occurred
-                violations.append(e)
-                if verbose:
-                    print(f"[AEGIS] Security violation: {e.violation_type}")
-                
-                # Get rollback events
-                rollback_events = self.rollback_handler.get_rollback_history(code_hash)
-                
-                # Get metrics (may be partial)
-                history = self.monitor.get_execution_history()
-                metrics = history[-1] if history else ExecutionMetrics()
-                metrics.violations_detected.extend(violations)
-            
-            # 6. Trust Score Update
-            if verbose:
-                print("[AEGIS] Phase 6: Trust score update...")
-            
-            trust_score = self.trust_manager.update_trust(
-                code_hash, metrics, violations
-            )
+                result = self._execute_analyzed(ast, code_hash, run_start, verbose)
+            except (LexicalError, AegisSyntaxError, SemanticError, AegisRuntimeError) as e:
+                result = self._failed_result(e, source_code, run_start, verbose)
+            results.append(result)
+        
+        return results
+    
+    def _analyze(self, source_code: str, verbose: bool) -> tuple:
+        """
+        Run the front-end phases: lexing, parsing and static analysis.
+        
+        Args:
+            source_code: The AEGIS source code to analyze
+            verbose: Whether to print execution information
             
-            # 7. Execution Complete
-            execution_time = time.time() - start_time
-            self.successful_executions += 1
+        Returns:
+            Tuple of (ast, code_hash)
             
-            if verbose:
-                print(f"[AEGIS] Execution completed successfully in {execution_time:.3f}s")
-                print(f"[AEGIS] Output: {context.output_buffer}")
+        Raises:
+            LexicalError, SyntaxError, SemanticError: If analysis fails
+        """
+        # 1. Lexical Analysis
+        if verbose:
+            print("[AEGIS] Phase 1: Lexical analysis...")
+        tokens = self.lexer.tokenize(source_code)
+        
+        # 2. Syntax Analysis
+        if verbose:
+            print("[AEGIS] Phase 2: Syntax analysis...")
+        ast = self.parser.parse(tokens)
+        
+        # 3. Static Security Analysis
+        if verbose:
+            print("[AEGIS] Phase 3: Static security analysis...")
+        analysis_passed = self.analyzer.analyze(ast)
+        if not analysis_passed:
+            raise AnalysisError("Static analysis failed")
+        
+        return ast, self.trust_manager.get_code_hash(source_code)
+    
+    def _execute_analyzed(self, ast: List, code_hash: str, start_time: float, 
+                          verbose: bool) -> ExecutionResult:
+        """
+        Run the back-end phases on an analyzed program.
+        
+        Args:
+            ast: Parsed and statically analyzed program
+            code_hash: Hash of the program source
+            start_time: Time the execution started, for execution_time
+            verbose: Whether to print execution information
             
-            return ExecutionResult(
-                success=True,
-                output=context.output_buffer,
-                execution_time=execution_time,
-                execution_mode=execution_mode,
-                trust_score=trust_score,
-                trust_level=trust_score_obj.get_trust_level(),
-                metrics=metrics,
-                violations=violations,
-                rollback_events=rollback_events
-            )
+        Returns:
+            ExecutionResult for a successful execution
             
-        except (LexicalError, AegisSyntaxError, SemanticError, AegisRuntimeError) as e:
-            # Execution failed - enhance error with source code context
-            execution_time = time.time() - start_time
+        Raises:
+            RuntimeError: If execution fails outside a security violation
+        """
+        # 4. Execution Mode Determination
+        trust_score_obj = self.trust_manager.get_trust_score(code_hash)
+        is_trusted = self.trust_manager.is_trusted_for_optimization(code_hash)
+        
+        execution_mode = 'optimized' if is_trusted else 'sandboxed'
+        
+        if verbose:
+            print(f"[AEGIS] Phase 4: Execution mode determination...")
+            print(f"[AEGIS] Trust score: {trust_score_obj.current_score:.2f} ({trust_score_obj.get_trust_level()})")
+            print(f"[AEGIS] Execution mode: {execution_mode.upper()}")
+        
+        # 5. Program Execution
+        if verbose:
+            print(f"[AEGIS] Phase 5: Program execution ({execution_mode})...")
+        
+        context = ExecutionContext()
+        violations = []
+        rollback_events = []
+        
+        try:
+            if execution_mode == 'sandboxed':
+                # Sandboxed execution
+                self.interpreter.execute(ast, context)
+                # Get metrics from monitor history
+                history = self.monitor.get_execution_history()
+                metrics = history[-1] if history else ExecutionMetrics()
+            else:
+                # Optimized execution
+                self.optimized_executions += 1
+                metrics = self.optimizer.execute_optimized(code_hash, ast, context)
             
-            # Add source code context to error if not already present
-            if hasattr(e, 'context') and e.context and not e.context.source_code:
-                e.context.source_code = source_code
+        except SecurityViolation as e:
+            # Security violation occurred
+            violations.append(e)
+            if verbose:
+                print(f"[AEGIS] Security violation: {e.violation_type}")
             
-            error_message = str(e)
+            # Get rollback events
+            rollback_events = self.rollback_handler.get_rollback_history(code_hash)
             
-            if verbose:
-                print(f"[AEGIS] Execution failed:")
-                print(f"[ERROR] {error_message}")
+            # Get metrics (may be partial)
+            history = self.monitor.get_execution_history()
+            metrics = history[-1] if history else ExecutionMetrics()
+            metrics.violations_detected.extend(violations)
+        
+        # 6. Trust Score Update
+        if verbose:
+            print("[AEGIS] Phase 6: Trust score update...")
+        
+        trust_score = self.trust_manager.update_trust(
+            code_hash, metrics, violations
+        )
+        
+        # 7. Execution Complete
+        execution_time = time.time() - start_time
+        self.successful_executions += 1
+        
+        if verbose:
+            print(f"[AEGIS] Execution completed successfully in {execution_time:.3f}s")
+            print(f"[AEGIS] Output: {context.output_buffer}")
+        
+        return ExecutionResult(
+            success=True,
+            output=context.output_buffer,
+            execution_time=execution_time,
+            execution_mode=execution_mode,
+            trust_score=trust_score,
+            trust_level=trust_score_obj.get_trust_level(),
+            metrics=metrics,
+            violations=violations,
+            rollback_events=rollback_events
+        )
+    
+    def _failed_result(self, error: Exception, source_code: str, start_time: float, 
+                       verbose: bool) -> ExecutionResult:
+        """
+        Build the result for an execution that failed with an AEGIS error.
+        
+        Args:
+            error: The lexical, syntax, semantic or runtime error raised
+            source_code: The AEGIS source code that was executed
+            start_time: Time the execution started, for execution_time
+            verbose: Whether to print execution information
             
-            return ExecutionResult(
-                success=False,
-                output=[],
-                execution_time=execution_time,
-                execution_mode='failed',
-                trust_score=0.0,
-                trust_level='NONE',
-                metrics=ExecutionMetrics(),
-                violations=[],
-                rollback_events=[],
-                error_message=error_message
-            )
+        Returns:
+            ExecutionResult describing the failure
+        """
+        # Execution failed - enhance error with source code context
+        execution_time = time.time() - start_time
+        
+        # Add source code context to error if not already present
+        if hasattr(error, 'context') and error.context and not error.context.source_code:
+            error.context.source_code = source_code
+        
+        error_message = str(error)
+        
+        if verbose:
+            print(f"[AEGIS] Execution failed:")
+            print(f"[ERROR] {error_message}")
+        
+        return ExecutionResult(
+            success=False,
+            output=[],
+            execution_time=execution_time,
+            execution_mode='failed',
+            trust_score=0.0,
+            trust_level='NONE',
+            metrics=ExecutionMetrics(),
+            violations=[],
+            rollback_events=[],
+            error_message=error_message
+        )
     
     def execute_batch(self, programs: List[str], verbose: bool = False) -> List[ExecutionResult]:
         """
@@ -400,6 +505,9 @@ class AegisExecutionPipeline:
         # Clean up old trust data
         self.trust_manager.cleanup_old_trust_data()
         
+        # Write any trust revocations deferred from rollbacks
+        self.trust_manager.flush()
+        
         # Clean up expired cache entries
         expired_count = self.cache.cleanup_expired()
         if expired_count > 0:
@@ -410,4 +518,21 @@ class AegisExecutionPipeline:
         if cleared_count > 0:
             print(f"[AEGIS] Cleaned up {cleared_count} old rollback events")
         
-        print("[AEGIS] System cleanup completed")
\ No newline at end of file
+        print("[AEGIS] System cleanup completed")
+    
+    def reset_trust_and_history(self) -> None:
+        """
+        Reset trust, cache and execution history in place.
+        
+        The pipeline keeps its components and configuration, so a single
+        instance can be reused where each use needs a fresh-pipeline state.
+        """
+        self.trust_manager.clear()
+        self.cache.clear_all()
+        self.monitor.reset()
+        self.rollback_handler.reset()
+        
+        self.total_executions = 0
+        self.successful_executions = 0
+        self.optimized_executions = 0
+        self.rollback_count = 0
\ No newline at end of file
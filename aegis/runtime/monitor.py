@@ -6,8 +6,9 @@ in real-time during program execution. It provides metrics collection
 and violation detection for the trust management system.
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Set
 from datetime import datetime
 from ..interpreter.context import ExecutionContext
 from ..errors import SecurityError
@@ -27,6 +28,8 @@ class ExecutionMetrics:
     operations_performed: List[str] = field(default_factory=list)
     violations_detected: List['SecurityViolation'] = field(default_factory=list)
     variables_accessed: List[str] = field(default_factory=list)
+    # Set mirror of variables_accessed for constant-time duplicate checks
+    _variables_seen: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
     arithmetic_operations: int = 0
     assignment_operations: int = 0
     print_operations: int = 0
@@ -38,6 +41,14 @@ class ExecutionMetrics:
     cache_hit: bool = False
     speedup_factor: float = 1.0
     
+    # Arithmetic operations by operator, so per-operator checks need not
+    # scan the operations_performed log
+    arithmetic_operators: Counter = field(default_factory=Counter)
+    
+    def __post_init__(self) -> None:
+        """Seed the duplicate-check set from any variables passed in."""
+        self._variables_seen = set(self.variables_accessed)
+    
     def add_operation(self, operation_type: str, details: str = "") -> None:
         """
         Record an operation performed during execution.
@@ -59,7 +70,8 @@ class ExecutionMetrics:
     
     def add_variable_access(self, variable_name: str) -> None:
         """Record access to a variable."""
-        if variable_name not in self.variables_accessed:
+        if variable_name not in self._variables_seen:
+            self._variables_seen.add(variable_name)
             self.variables_accessed.append(variable_name)
     
     def start_timing(self) -> None:
@@ -267,6 +279,7 @@ class RuntimeMonitor:
         if not self.is_monitoring:
             return
         
+        self.current_metrics.arithmetic_operators[operator] += 1
         details = f"{left} {operator} {right} = {result}"
         self.record_operation("arithmetic", details)
         
@@ -324,6 +337,20 @@ class RuntimeMonitor:
         """
         return self.execution_history.copy()
     
+    def reset(self) -> None:
+        """
+        Discard any in-progress execution and the execution history.
+        
+        Thresholds and the rollback callback are kept, so a wired-up monitor
+        can be reused as if newly constructed.
+        """
+        self.current_metrics = None
+        self.execution_history.clear()
+        self.is_monitoring = False
+        self.monitored_context = None
+        self.current_execution_mode = 'sandboxed'
+        self.current_code_hash = None
+    
     def get_average_metrics(self) -> Dict[str, float]:
         """
         Get average metrics across execution history.
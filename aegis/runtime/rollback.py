@@ -7,15 +7,19 @@ and maintaining execution state consistency.
 """
 
 import time
+from collections import Counter, defaultdict, deque
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Callable
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Callable, Deque
 from ..interpreter.context import ExecutionContext
 from ..runtime.monitor import SecurityViolation, ExecutionMetrics
 from ..ast.nodes import ASTNode
 
+# Nanoseconds per day, for comparing event timestamps against age cutoffs
+_NS_PER_DAY = 24 * 60 * 60 * 10**9
 
-@dataclass
+
+@dataclass(slots=True)
 class RollbackEvent:
     """
     Represents a rollback occurrence with comprehensive details.
@@ -23,7 +27,7 @@ class RollbackEvent:
     This class captures all relevant information about a rollback event
     for analysis, logging, and trust management decisions.
     """
-    timestamp: datetime
+    timestamp_ns: int  # Wall-clock time of the rollback, in ns since the epoch
     violation_type: str
     code_hash: str
     details: str
@@ -34,6 +38,11 @@ class RollbackEvent:
     trust_score_before: float
     trust_score_after: float
     
+    @property
+    def timestamp(self) -> datetime:
+        """Time of the rollback, built from timestamp_ns on access."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -69,20 +78,36 @@ class RollbackHandler:
     
     def __init__(self):
         """Initialize the rollback handler."""
-        self.rollback_history: List[RollbackEvent] = []
+        # Bounded ring buffer: appending past max_rollback_history drops the
+        # oldest events without copying the history
+        self.rollback_history: Deque[RollbackEvent] = deque(maxlen=100)
+        # Per-key indexes over rollback_history, in history order, so filtered
+        # queries only touch the matching events
+        self._history_by_type: Dict[str, Deque[RollbackEvent]] = defaultdict(deque)
+        self._history_by_code: Dict[str, Deque[RollbackEvent]] = defaultdict(deque)
         self.rollback_callbacks: List[Callable[[RollbackEvent], None]] = []
         self.cache_clear_callback: Optional[Callable[[str], None]] = None
         self.trust_update_callback: Optional[Callable[[str, str, str], None]] = None
         
         # Rollback configuration
-        self.max_rollback_history = 100
         self.rollback_enabled = True
         self.auto_trust_revocation = True
         
         # Statistics
         self.total_rollbacks = 0
-        self.rollbacks_by_type: Dict[str, int] = {}
-        self.rollbacks_by_code: Dict[str, int] = {}
+        self.rollbacks_by_type: Counter = Counter()
+        self.rollbacks_by_code: Counter = Counter()
+    
+    @property
+    def max_rollback_history(self) -> int:
+        """Maximum number of rollback events kept in history."""
+        return self.rollback_history.maxlen
+    
+    @max_rollback_history.setter
+    def max_rollback_history(self, size: int) -> None:
+        # A deque's bound is fixed, so keep the most recent events in a new one
+        self.rollback_history = deque(self.rollback_history, maxlen=size)
+        self._rebuild_history_indexes()
     
     def register_cache_clear_callback(self, callback: Callable[[str], None]) -> None:
         """
@@ -133,7 +158,74 @@ class RollbackHandler:
             print(f"[ROLLBACK] Rollback disabled - ignoring violation: {violation_type}")
             return None
         
-        rollback_start = time.time()
+        rollback_event = self._perform_rollback(
+            violation_type, code_hash, details, context, violations, trust_score_before
+        )
+        
+        # Record rollback
+        self._record_rollbacks([rollback_event])
+        
+        # Notify callbacks
+        self._notify_rollback(rollback_event)
+        
+        print(f"[ROLLBACK] Rollback completed in {rollback_event.rollback_time:.3f}s")
+        print(f"[ROLLBACK] Code {code_hash[:8]}... will execute in sandboxed mode")
+        
+        return rollback_event
+    
+    def trigger_rollback_batch(self, rollbacks: List[Dict[str, Any]]) -> List[RollbackEvent]:
+        """
+        Trigger several rollbacks, recording them together.
+        
+        Each rollback is performed exactly as by trigger_rollback, but the
+        history and statistics are updated once for the whole batch.
+        
+        Args:
+            rollbacks: Keyword-argument dicts for trigger_rollback, one per
+                rollback, each with at least violation_type, code_hash and details
+            
+        Returns:
+            RollbackEvent for each rollback, in order (empty if rollback is disabled)
+            
+        Raises:
+            TypeError: If an entry is missing a required argument; the
+                rollbacks before it are still recorded
+        """
+        if not self.rollback_enabled:
+            print(f"[ROLLBACK] Rollback disabled - ignoring {len(rollbacks)} violations")
+            return []
+        
+        rollback_events = []
+        try:
+            for rollback in rollbacks:
+                rollback_events.append(self._perform_rollback(**rollback))
+        finally:
+            # Performed rollbacks have already cleared caches and revoked
+            # trust, so they are recorded and announced even if a later
+            # entry fails
+            self._record_rollbacks(rollback_events)
+            
+            for rollback_event in rollback_events:
+                self._notify_rollback(rollback_event)
+        
+        print(f"[ROLLBACK] Batch of {len(rollback_events)} rollbacks completed")
+        
+        return rollback_events
+    
+    def _perform_rollback(self, violation_type: str, code_hash: str, details: str,
+                          context: ExecutionContext = None, 
+                          violations: List[SecurityViolation] = None,
+                          trust_score_before: float = 0.0) -> RollbackEvent:
+        """
+        Roll back compromised code and describe the rollback.
+        
+        Clears the code's cached optimization, captures the context state
+        and updates trust. The event is not recorded or announced.
+        
+        Returns:
+            RollbackEvent describing the rollback
+        """
+        rollback_start = time.perf_counter()
         
         print(f"[ROLLBACK] Security violation detected: {violation_type}")
         print(f"[ROLLBACK] Code: {code_hash[:8]}... - {details}")
@@ -160,11 +252,11 @@ class RollbackHandler:
             # Assume trust score is significantly reduced after violation
             trust_score_after = max(0.0, trust_score_before - 0.5)
         
-        rollback_time = time.time() - rollback_start
+        rollback_time = time.perf_counter() - rollback_start
         
         # Create rollback event
-        rollback_event = RollbackEvent(
-            timestamp=datetime.now(),
+        return RollbackEvent(
+            timestamp_ns=time.time_ns(),
             violation_type=violation_type,
             code_hash=code_hash,
             details=details,
@@ -175,21 +267,19 @@ class RollbackHandler:
             trust_score_before=trust_score_before,
             trust_score_after=trust_score_after
         )
+    
+    def _notify_rollback(self, rollback_event: RollbackEvent) -> None:
+        """
+        Notify registered callbacks of a rollback event.
         
-        # Record rollback
-        self._record_rollback(rollback_event)
-        
-        # Notify callbacks
+        Args:
+            rollback_event: RollbackEvent to announce
+        """
         for callback in self.rollback_callbacks:
             try:
                 callback(rollback_event)
             except Exception as e:
                 print(f"[ROLLBACK] Warning: Callback failed - {e}")
-        
-        print(f"[ROLLBACK] Rollback completed in {rollback_time:.3f}s")
-        print(f"[ROLLBACK] Code {code_hash[:8]}... will execute in sandboxed mode")
-        
-        return rollback_event
     
     def should_rollback(self, violations: List[SecurityViolation], 
                        execution_mode: str = 'optimized') -> bool:
@@ -251,15 +341,21 @@ class RollbackHandler:
         Returns:
             List of matching rollback events
         """
-        history = self.rollback_history
+        if code_hash and violation_type:
+            # Scan the smaller index and check the other key on each event
+            by_code = self._history_by_code.get(code_hash, ())
+            by_type = self._history_by_type.get(violation_type, ())
+            if len(by_code) <= len(by_type):
+                return [event for event in by_code if event.violation_type == violation_type]
+            return [event for event in by_type if event.code_hash == code_hash]
         
         if code_hash:
-            history = [event for event in history if event.code_hash == code_hash]
+            return list(self._history_by_code.get(code_hash, ()))
         
         if violation_type:
-            history = [event for event in history if event.violation_type == violation_type]
+            return list(self._history_by_type.get(violation_type, ()))
         
-        return history
+        return list(self.rollback_history)
     
     def get_rollback_statistics(self) -> Dict[str, Any]:
         """
@@ -268,10 +364,11 @@ class RollbackHandler:
         Returns:
             Dictionary with rollback statistics
         """
-        recent_rollbacks = len([
-            event for event in self.rollback_history
-            if (datetime.now() - event.timestamp).days < 7
-        ])
+        recent_cutoff_ns = time.time_ns() - _NS_PER_DAY * 7
+        recent_rollbacks = sum(
+            1 for event in self.rollback_history
+            if event.timestamp_ns > recent_cutoff_ns
+        )
         
         avg_rollback_time = 0.0
         if self.rollback_history:
@@ -302,19 +399,37 @@ class RollbackHandler:
             # Clear all history
             cleared_count = len(self.rollback_history)
             self.rollback_history.clear()
+            self._history_by_type.clear()
+            self._history_by_code.clear()
         else:
             # Clear old events
-            cutoff_date = datetime.now() - timedelta(days=older_than_days)
+            cutoff_ns = time.time_ns() - _NS_PER_DAY * older_than_days
             original_count = len(self.rollback_history)
-            self.rollback_history = [
-                event for event in self.rollback_history
-                if event.timestamp > cutoff_date
-            ]
+            self.rollback_history = deque(
+                (event for event in self.rollback_history
+                 if event.timestamp_ns > cutoff_ns),
+                maxlen=self.max_rollback_history
+            )
+            self._rebuild_history_indexes()
             cleared_count = original_count - len(self.rollback_history)
         
         print(f"[ROLLBACK] Cleared {cleared_count} rollback events from history")
         return cleared_count
     
+    def reset(self) -> None:
+        """
+        Clear rollback history and statistics in place.
+        
+        Configuration and registered callbacks are kept, so a wired-up
+        handler can be reused as if newly constructed.
+        """
+        self.rollback_history.clear()
+        self._history_by_type.clear()
+        self._history_by_code.clear()
+        self.total_rollbacks = 0
+        self.rollbacks_by_type.clear()
+        self.rollbacks_by_code.clear()
+    
     def enable_rollback(self, enabled: bool = True) -> None:
         """
         Enable or disable rollback functionality.
@@ -337,29 +452,48 @@ class RollbackHandler:
         status = "enabled" if enabled else "disabled"
         print(f"[ROLLBACK] Automatic trust revocation {status}")
     
-    def _record_rollback(self, event: RollbackEvent) -> None:
+    def _record_rollbacks(self, events: List[RollbackEvent]) -> None:
         """
-        Record a rollback event in history and update statistics.
+        Record rollback events in history and update statistics.
         
         Args:
-            event: RollbackEvent to record
+            events: RollbackEvents to record, in order
         """
-        # Add to history
-        self.rollback_history.append(event)
-        
-        # Maintain history size limit
-        if len(self.rollback_history) > self.max_rollback_history:
-            self.rollback_history = self.rollback_history[-self.max_rollback_history:]
+        for event in events:
+            # The bounded deque drops its oldest event when full, and that
+            # event is also the oldest in both of its indexes
+            if self.rollback_history and len(self.rollback_history) == self.rollback_history.maxlen:
+                self._unindex_oldest(self.rollback_history[0])
+            
+            self.rollback_history.append(event)
+            
+            # With a history size of 0 nothing is kept, so nothing is indexed
+            if self.rollback_history:
+                self._history_by_type[event.violation_type].append(event)
+                self._history_by_code[event.code_hash].append(event)
         
         # Update statistics
-        self.total_rollbacks += 1
-        
-        if event.violation_type in self.rollbacks_by_type:
-            self.rollbacks_by_type[event.violation_type] += 1
-        else:
-            self.rollbacks_by_type[event.violation_type] = 1
+        self.total_rollbacks += len(events)
+        self.rollbacks_by_type.update(event.violation_type for event in events)
+        self.rollbacks_by_code.update(event.code_hash for event in events)
+    
+    def _unindex_oldest(self, event: RollbackEvent) -> None:
+        """
+        Remove the oldest history event from the per-key indexes.
         
-        if event.code_hash in self.rollbacks_by_code:
-            self.rollbacks_by_code[event.code_hash] += 1
-        else:
-            self.rollbacks_by_code[event.code_hash] = 1
\ No newline at end of file
+        Args:
+            event: RollbackEvent about to be dropped from history
+        """
+        for index, key in ((self._history_by_type, event.violation_type),
+                           (self._history_by_code, event.code_hash)):
+            index[key].popleft()
+            if not index[key]:
+                del index[key]
+    
+    def _rebuild_history_indexes(self) -> None:
+        """Rebuild the per-key indexes from the current history."""
+        self._history_by_type.clear()
+        self._history_by_code.clear()
+        for event in self.rollback_history:
+            self._history_by_type[event.violation_type].append(event)
+            self._history_by_code[event.code_hash].append(event)
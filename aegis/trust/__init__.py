@@ -2,7 +2,7 @@
 Trust module for AEGIS - Trust score management and policies.
 """
 
-from .trust_manager import TrustManager, TrustScore
+from .trust_manager import MEMORY_TRUST_FILE, TrustManager, TrustScore
 from .trust_policy import TrustPolicy
 
-__all__ = ['TrustManager', 'TrustScore', 'TrustPolicy']
\ No newline at end of file
+__all__ = ['MEMORY_TRUST_FILE', 'TrustManager', 'TrustScore', 'TrustPolicy']
\ No newline at end of file
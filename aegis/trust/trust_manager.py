@@ -15,6 +15,11 @@ from datetime import datetime, timedelta
 from ..runtime.monitor import ExecutionMetrics, SecurityViolation
 
 
+# Trust file sentinel that keeps trust data in memory only, without
+# touching the filesystem (mirrors sqlite's ":memory:" database)
+MEMORY_TRUST_FILE = ":memory:"
+
+
 @dataclass
 class TrustScore:
     """
@@ -245,12 +250,15 @@ class TrustManager:
         Initialize the trust manager.
         
         Args:
-            trust_file: File path for persisting trust data
+            trust_file: File path for persisting trust data, or
+                MEMORY_TRUST_FILE to keep trust data in memory only
         """
         self.trust_file = trust_file
         self.trust_scores: Dict[str, TrustScore] = {}
         self.trust_threshold = 1.0
         self.optimization_enabled = True
+        # Set when in-memory trust data has changes not yet written to disk
+        self._dirty = False
         
         # Load existing trust data
         self._load_trust_data()
@@ -340,8 +348,6 @@ class TrustManager:
             
             print(f"[TRUST] Revoked trust for code {code_hash[:8]}... "
                   f"(was {old_score:.2f}, now 0.00) - {violation_type}: {details}")
-            
-            self._save_trust_data()
         else:
             # Create new trust score with violation
             trust_score = TrustScore(code_hash=code_hash)
@@ -350,8 +356,10 @@ class TrustManager:
             
             print(f"[TRUST] Created new trust record for code {code_hash[:8]}... "
                   f"with violation - {violation_type}: {details}")
-            
-            self._save_trust_data()
+        
+        # Revocations run on the rollback path, so the write is deferred to
+        # the next trust update or flush() instead of hitting the disk here
+        self._dirty = True
     
     def revoke_trust(self, code_hash: str, reason: str = "manual_revocation") -> None:
         """
@@ -370,6 +378,21 @@ class TrustManager:
             
             self._save_trust_data()
     
+    def flush(self) -> None:
+        """Write deferred trust changes, such as violation revocations, to the trust file."""
+        if self._dirty:
+            self._save_trust_data()
+    
+    def clear(self) -> None:
+        """
+        Remove all trust scores in place.
+        
+        The threshold and optimization settings are kept. Persisted trust
+        data is rewritten on the next trust update or flush().
+        """
+        self.trust_scores.clear()
+        self._dirty = True
+    
     def get_trust_summary(self) -> Dict[str, Any]:
         """
         Get summary of all trust scores.
@@ -450,6 +473,10 @@ class TrustManager:
     
     def _save_trust_data(self) -> None:
         """Save trust data to file."""
+        self._dirty = False
+        if self.trust_file == MEMORY_TRUST_FILE:
+            return
+        
         try:
             data = {
                 'trust_scores': {k: v.to_dict() for k, v in self.trust_scores.items()},
@@ -466,6 +493,9 @@ class TrustManager:
     
     def _load_trust_data(self) -> None:
         """Load trust data from file."""
+        if self.trust_file == MEMORY_TRUST_FILE:
+            return
+        
         try:
             if os.path.exists(self.trust_file):
                 with open(self.trust_file, 'r') as f:
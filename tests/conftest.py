@@ -5,13 +5,100 @@ This module provides common test fixtures and configuration
 for the AEGIS test suite, including property-based testing setup.
 """
 
+import functools
+import os
+
 import pytest
-from hypothesis import settings, Verbosity
+from hypothesis import settings, Phase, Verbosity
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+from aegis.lexer import Lexer
+from aegis.parser import Parser
+from aegis.ast import ASTPrettyPrinter
 
 # Configure Hypothesis for property-based testing
 settings.register_profile("default", max_examples=100, verbosity=Verbosity.normal)
-settings.register_profile("ci", max_examples=1000, verbosity=Verbosity.verbose)
-settings.load_profile("default")
+# CI favours reproducible, fast runs: fixed examples, no database, no shrinking.
+# Explicit @example cases still run.
+# The exhaustive verbose run lives in the nightly profile.
+settings.register_profile(
+    "ci",
+    derandomize=True,
+    database=None,
+    max_examples=50,
+    deadline=None,
+    phases=[Phase.explicit, Phase.generate],
+)
+settings.register_profile("nightly", max_examples=1000, verbosity=Verbosity.verbose)
+# Under pytest-xdist each worker gets its own example database directory
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+settings.register_profile(
+    "xdist",
+    parent=settings.get_profile("default"),
+    database=DirectoryBasedExampleDatabase(
+        f".hypothesis/examples-{_XDIST_WORKER or 'main'}"
+    ),
+)
+settings.load_profile("xdist" if _XDIST_WORKER else "default")
+
+
+def pytest_configure(config):
+    """Register custom markers so they work with or without pytest-xdist."""
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run tests sharing a group on the same xdist worker"
+    )
+
+
+@pytest.fixture(scope="session")
+def lexer():
+    """Shared lexer; tokenize() resets all scanning state on each call."""
+    return Lexer()
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """Shared parser; parse() resets all parsing state on each call."""
+    return Parser()
+
+
+@pytest.fixture(scope="session")
+def printer():
+    """Shared AST pretty printer."""
+    return ASTPrettyPrinter()
+
+
+@functools.lru_cache(maxsize=None)
+def _tokenize_cached(source: str) -> tuple:
+    """Tokenize source once per distinct string; the parser only reads tokens."""
+    return tuple(Lexer().tokenize(source))
+
+
+@pytest.fixture(scope="session")
+def tokenize_cached():
+    """Memoized tokenizer returning an immutable token sequence."""
+    return _tokenize_cached
+
+
+@pytest.fixture(scope="session")
+def parsed(tokenize_cached, parser):
+    """
+    Memoized tokenize+parse shared by every test in the session.
+    
+    Returns a function mapping source code to a (tokens, ast) pair. The
+    AST is shared between callers, so tests must treat it as read-only.
+    Under pytest-xdist each worker builds its own cache; entries are pure
+    memoization, so parser tests need no xdist_group pinning.
+    """
+    cache = {}
+    
+    def get(source):
+        if source not in cache:
+            tokens = tokenize_cached(source)
+            cache[source] = (tokens, parser.parse(tokens))
+        return cache[source]
+    
+    return get
 
 
 @pytest.fixture
@@ -280,6 +280,57 @@ class TestFinalIntegration:
                 if os.path.exists(temp_file):
                     os.unlink(temp_file)
     
+    def test_execute_many_matches_repeated_execution(self):
+        """Test that execute_many behaves like repeated execute calls."""
+        program = "x = 6\ny = x * 7\nprint y"
+        
+        results = self.pipeline.execute_many(program, 12)
+        
+        assert len(results) == 12
+        assert all(result.success for result in results)
+        assert all(result.output == ['42'] for result in results)
+        
+        # Trust is re-checked per execution, so the batch crosses into optimization
+        trust_scores = [result.trust_score for result in results]
+        assert trust_scores == sorted(trust_scores)
+        assert results[0].execution_mode == 'sandboxed'
+        assert results[-1].execution_mode == 'optimized'
+        assert self.pipeline.total_executions == 12
+        
+        # Front-end failures are reported for every requested execution
+        failures = self.pipeline.execute_many("x = + 10", 3)
+        assert len(failures) == 3
+        assert not any(result.success for result in failures)
+        assert self.pipeline.total_executions == 15
+    
+    def test_execute_many_rejects_non_positive_count(self):
+        """Test that execute_many requires at least one execution."""
+        for count in (0, -1):
+            with pytest.raises(ValueError):
+                self.pipeline.execute_many("x = 5\nprint x", count)
+        
+        assert self.pipeline.total_executions == 0
+    
+    def test_reset_trust_and_history_restores_fresh_state(self):
+        """Test that a reset pipeline behaves like a newly built one."""
+        program = "x = 6\ny = x * 7\nprint y"
+        
+        results = self.pipeline.execute_many(program, 12)
+        assert results[-1].execution_mode == 'optimized'
+        
+        self.pipeline.reset_trust_and_history()
+        
+        status = self.pipeline.get_system_status()
+        assert status['execution_stats']['total_executions'] == 0
+        assert status['trust_system']['total_codes'] == 0
+        assert status['cache_system']['cache_size'] == 0
+        
+        # Trust starts over, so the program is sandboxed again
+        result = self.pipeline.execute(program, verbose=False)
+        assert result.success
+        assert result.execution_mode == 'sandboxed'
+        assert result.output == ['42']
+    
     def test_edge_case_programs(self):
         """Test edge cases and boundary conditions."""
         edge_cases = [
@@ -6,17 +6,181 @@ equivalence with the sandboxed interpreter while providing performance benefits.
 """
 
 import pytest
-from hypothesis import given, strategies as st, assume, settings
+from hypothesis import given, example, strategies as st, settings, Phase
 from aegis.compiler.optimizer import OptimizedExecutor, ASTOptimizer
 from aegis.compiler.cache import CodeCache
 from aegis.interpreter.interpreter import SandboxedInterpreter
 from aegis.interpreter.context import ExecutionContext
 from aegis.runtime.monitor import RuntimeMonitor
 from aegis.ast.nodes import AssignmentNode, BinaryOpNode, IdentifierNode, IntegerNode, PrintNode
-from aegis.lexer.lexer import Lexer
-from aegis.parser.parser import Parser
+import gc
+import hashlib
 import tempfile
 import os
+from contextlib import contextmanager
+from functools import lru_cache
+
+# Equivalence failures are hard bugs, so skip shrinking and the example
+# database and run a deterministic set of examples on every invocation.
+# Applied per test as a parent so the global profile is left untouched.
+FAST = settings(
+    derandomize=True,
+    database=None,
+    phases=[Phase.explicit, Phase.generate],
+    deadline=None,
+)
+
+# Interpreter results keyed by canonical AST structure as
+# (variables, output_buffer); the interpreter is the slow leg, so each
+# distinct program is only interpreted once regardless of its code hash
+_ORACLE_CACHE: dict = {}
+
+
+def _canonical(node) -> tuple:
+    """
+    Structural key for an AST node or list of nodes.
+    
+    Variable names are kept as-is: the oracle's variable state is compared
+    by name, so alpha-renamed programs cannot share an entry.
+    """
+    match node:
+        case IntegerNode(value):
+            return ('int', value)
+        case IdentifierNode(name):
+            return ('id', name)
+        case BinaryOpNode(left, operator, right):
+            return ('bin', _canonical(left), operator, _canonical(right))
+        case AssignmentNode(identifier, expression):
+            return ('assign', identifier, _canonical(expression))
+        case PrintNode(identifier):
+            return ('print', identifier)
+        case _:
+            return tuple(_canonical(child) for child in node)
+
+
+def _snapshot_hash(context: ExecutionContext) -> int:
+    """Digest of a context's variables and output for cheap equality checks."""
+    return hash((tuple(sorted(context.variables.items())), tuple(context.output_buffer)))
+
+
+@contextmanager
+def _no_gc():
+    """Suspend the cyclic garbage collector for the duration of the block."""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _stable_digest(values) -> str:
+    """Process-independent digest of a sequence, unlike the seeded hash()."""
+    return hashlib.blake2b(repr(tuple(values)).encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _check_metrics(metrics, want_hit=None) -> None:
+    """
+    Assert the invariants every optimized execution must satisfy.
+    
+    Args:
+        metrics: ExecutionMetrics returned by the optimized executor
+        want_hit: Expected cache_hit value, or None to skip that check
+    """
+    assert metrics.optimization_applied is True, "Optimized execution should be marked as such"
+    if want_hit is not None:
+        assert metrics.cache_hit is want_hit, \
+            f"Expected cache_hit={want_hit}, got {metrics.cache_hit}"
+
+
+# Arithmetic operands: small values plus zero and values whose products
+# leave the 32-bit range, so division by zero and overflow are exercised
+_ARITH_OPERAND = st.one_of(
+    st.integers(min_value=-1000, max_value=1000),
+    st.sampled_from([0, 46341, -46341, 2**31 - 1])
+)
+
+
+@lru_cache(maxsize=8192)
+def _arith_ast(left_val: int, operator: str, right_val: int) -> tuple:
+    """
+    Build the AST for ``result = left_val operator right_val``.
+    
+    Cached because Hypothesis regenerates the same operand triples; the
+    interpreter and optimizer only read the AST, so sharing it is safe.
+    """
+    return (
+        AssignmentNode(
+            "result",
+            BinaryOpNode(IntegerNode(left_val), operator, IntegerNode(right_val))
+        ),
+    )
+
+
+@st.composite
+def assignment_programs(draw):
+    """
+    Generate ``x0 = v0; x1 = v1; ...`` programs.
+    
+    Returns:
+        Tuple of (ast, values)
+    """
+    values = draw(st.lists(st.integers(min_value=0, max_value=100), min_size=1, max_size=5))
+    ast = [AssignmentNode(f"x{i}", IntegerNode(value)) for i, value in enumerate(values)]
+    return ast, values
+
+
+@st.composite
+def print_programs(draw):
+    """
+    Generate programs that assign 10, 20, 30, ... to distinct variables and print each.
+    
+    Returns:
+        Tuple of (ast, variable_names, expected_values)
+    """
+    var_names = draw(st.lists(st.text(alphabet="abcdefghijklmnopqrstuvwxyz", min_size=1, max_size=5),
+                              min_size=1, max_size=3))
+    unique_vars = list(dict.fromkeys(var_names))
+    
+    ast = []
+    expected_values = []
+    for i, var_name in enumerate(unique_vars):
+        value = (i + 1) * 10
+        expected_values.append(value)
+        ast.append(AssignmentNode(var_name, IntegerNode(value)))
+        ast.append(PrintNode(var_name))
+    return ast, unique_vars, expected_values
+
+
+def _complex_ast(var_name: str, base_value: int) -> list:
+    """Build the AST for ``var = base; result = var + 2 * 3 - 1``."""
+    return [
+        AssignmentNode(var_name, IntegerNode(base_value)),
+        AssignmentNode(
+            "result",
+            BinaryOpNode(
+                IdentifierNode(var_name),
+                "+",
+                BinaryOpNode(
+                    BinaryOpNode(IntegerNode(2), "*", IntegerNode(3)),
+                    "-",
+                    IntegerNode(1)
+                )
+            )
+        )
+    ]
+
+
+def _simple_program_ast(val1: int, val2: int) -> list:
+    """Build the AST for ``a = val1; b = val2; c = a + b; d = c * 2; print d``."""
+    return [
+        AssignmentNode("a", IntegerNode(val1)),
+        AssignmentNode("b", IntegerNode(val2)),
+        AssignmentNode("c", BinaryOpNode(IdentifierNode("a"), "+", IdentifierNode("b"))),
+        AssignmentNode("d", BinaryOpNode(IdentifierNode("c"), "*", IntegerNode(2))),
+        PrintNode("d")
+    ]
 
 
 class TestOptimizedExecutorProperties:
@@ -30,10 +194,70 @@ class TestOptimizedExecutorProperties:
         self.optimizer = OptimizedExecutor(self.cache, self.monitor)
         self.interpreter = SandboxedInterpreter(self.monitor)
     
-    @given(st.integers(min_value=-1000, max_value=1000),
-           st.integers(min_value=-1000, max_value=1000))
-    @settings(max_examples=50, deadline=2000)
-    def test_arithmetic_semantic_equivalence(self, left_val, right_val):
+    @classmethod
+    def teardown_class(cls):
+        """Drop cached interpreter results once the class has finished."""
+        _ORACLE_CACHE.clear()
+    
+    def interpret(self, ast):
+        """
+        Run the interpreter oracle for a program, reusing earlier results.
+        
+        Args:
+            ast: List of AST nodes to execute
+            
+        Returns:
+            Tuple of (variables, output_buffer) produced by the interpreter
+        """
+        key = _canonical(ast)
+        oracle = _ORACLE_CACHE.get(key)
+        if oracle is None:
+            context = ExecutionContext()
+            self.interpreter.execute(ast, context)
+            oracle = (dict(context.variables), list(context.output_buffer))
+            _ORACLE_CACHE[key] = oracle
+        return oracle
+    
+    def _assert_semantic_equivalence(self, ast, code_hash, want_hit=None):
+        """
+        Execute an AST optimized and assert it matches the interpreter.
+        
+        The optimized path runs first and is compared with the interpreter
+        oracle, which is only executed the first time a program structure is seen.
+        
+        Args:
+            ast: List of AST nodes to execute
+            code_hash: Hash identifying the program
+            want_hit: Expected cache_hit value, or None to skip that check
+            
+        Returns:
+            Tuple of (optimized context, optimized metrics)
+        """
+        # Both executions allocate many short-lived objects; keep collector
+        # pauses out of the executor/interpreter pair
+        with _no_gc():
+            context_optimized = ExecutionContext()
+            metrics = self.optimizer.execute_optimized(code_hash, ast, context_optimized)
+            
+            interpreted_variables, interpreted_output = self.interpret(ast)
+        
+        assert context_optimized.variables == interpreted_variables, \
+            f"Variable mismatch: interpreted={interpreted_variables}, " \
+            f"optimized={context_optimized.variables}, " \
+            f"differing keys={set(interpreted_variables) ^ set(context_optimized.variables)}"
+        assert context_optimized.output_buffer == interpreted_output, \
+            f"Output mismatch: interpreted={interpreted_output}, " \
+            f"optimized={context_optimized.output_buffer}"
+        
+        _check_metrics(metrics, want_hit)
+        
+        return context_optimized, metrics
+    
+    @given(_ARITH_OPERAND, _ARITH_OPERAND, st.sampled_from(['+', '-', '*', '/']))
+    @example(7, 0, '/')
+    @example(46341, 46341, '*')
+    @settings(FAST, max_examples=50)
+    def test_arithmetic_semantic_equivalence(self, left_val, right_val, operator):
         """
         **Feature: aegis, Property 10a: Arithmetic Semantic Equivalence**
         
@@ -43,56 +267,24 @@ class TestOptimizedExecutorProperties:
         
         **Validates: Requirements 8.4**
         """
-        # Test all arithmetic operators
-        operators = ['+', '-', '*']
-        if right_val != 0:  # Avoid division by zero
-            operators.append('/')
+        # AST for: result = left_val operator right_val
+        ast = _arith_ast(left_val, operator, right_val)
+        code_hash = f"arith_{left_val}_{operator}_{right_val}"
         
-        for operator in operators:
-            # Create AST for: result = left_val operator right_val
-            ast = [
-                AssignmentNode(
-                    "result",
-                    BinaryOpNode(IntegerNode(left_val), operator, IntegerNode(right_val))
-                )
-            ]
-            
-            # Execute with sandboxed interpreter
-            context_interpreted = ExecutionContext()
-            try:
-                self.interpreter.execute(ast, context_interpreted)
-                interpreted_result = context_interpreted.get_variable("result")
-            except Exception as e:
-                # If interpreter fails, optimized should fail the same way
-                context_optimized = ExecutionContext()
-                with pytest.raises(type(e)):
-                    code_hash = f"arith_{left_val}_{operator}_{right_val}"
-                    self.optimizer.execute_optimized(code_hash, ast, context_optimized)
-                continue
-            
-            # Execute with optimized executor
-            context_optimized = ExecutionContext()
-            code_hash = f"arith_{left_val}_{operator}_{right_val}"
-            
-            try:
-                metrics = self.optimizer.execute_optimized(code_hash, ast, context_optimized)
-                optimized_result = context_optimized.get_variable("result")
-                
-                # Results must be identical
-                assert optimized_result == interpreted_result, \
-                    f"Semantic mismatch: {left_val} {operator} {right_val} = " \
-                    f"interpreted: {interpreted_result}, optimized: {optimized_result}"
-                
-                # Optimized execution should be marked as such
-                assert metrics.optimization_applied is True
-                
-            except Exception as e:
-                # If optimized fails, it should be the same type of error
-                pytest.fail(f"Optimized execution failed where interpreted succeeded: {e}")
+        try:
+            self.interpret(ast)
+        except Exception as e:
+            # If interpreter fails, optimized should fail the same way
+            with pytest.raises(type(e)):
+                self.optimizer.execute_optimized(code_hash, ast, ExecutionContext())
+            return
+        
+        context, _ = self._assert_semantic_equivalence(ast, code_hash)
+        assert context.is_variable_defined("result")
     
-    @given(st.lists(st.integers(min_value=0, max_value=100), min_size=1, max_size=5))
-    @settings(max_examples=30, deadline=2000)
-    def test_variable_assignment_semantic_equivalence(self, values):
+    @given(assignment_programs())
+    @settings(FAST, max_examples=30)
+    def test_variable_assignment_semantic_equivalence(self, program):
         """
         **Feature: aegis, Property 10b: Variable Assignment Semantic Equivalence**
         
@@ -101,39 +293,16 @@ class TestOptimizedExecutorProperties:
         
         **Validates: Requirements 8.4**
         """
-        # Create a sequence of assignments: x0 = values[0], x1 = values[1], etc.
-        ast = []
-        variable_names = []
-        
-        for i, value in enumerate(values):
-            var_name = f"x{i}"
-            variable_names.append(var_name)
-            ast.append(AssignmentNode(var_name, IntegerNode(value)))
-        
-        # Execute with sandboxed interpreter
-        context_interpreted = ExecutionContext()
-        self.interpreter.execute(ast, context_interpreted)
-        
-        # Execute with optimized executor
-        context_optimized = ExecutionContext()
-        code_hash = f"assignments_{hash(tuple(values))}"
-        
-        metrics = self.optimizer.execute_optimized(code_hash, ast, context_optimized)
-        
-        # All variables must have identical values
-        for var_name in variable_names:
-            interpreted_val = context_interpreted.get_variable(var_name)
-            optimized_val = context_optimized.get_variable(var_name)
-            
-            assert optimized_val == interpreted_val, \
-                f"Variable {var_name}: interpreted={interpreted_val}, optimized={optimized_val}"
+        # Sequence of assignments: x0 = values[0], x1 = values[1], etc.
+        ast, values = program
+        code_hash = f"assignments_{_stable_digest(values)}"
         
-        # Optimized execution should be marked as such
-        assert metrics.optimization_applied is True
+        context, _ = self._assert_semantic_equivalence(ast, code_hash)
+        assert len(context.variables) == len(values)
     
     @given(st.text(alphabet="abcdefghijklmnopqrstuvwxyz", min_size=1, max_size=8),
            st.integers(min_value=1, max_value=50))
-    @settings(max_examples=20, deadline=2000)
+    @settings(FAST, max_examples=20)
     def test_complex_expression_semantic_equivalence(self, var_name, base_value):
         """
         **Feature: aegis, Property 10c: Complex Expression Semantic Equivalence**
@@ -143,54 +312,16 @@ class TestOptimizedExecutorProperties:
         
         **Validates: Requirements 8.4**
         """
-        # Create complex expression: var = base_value; result = var + 2 * 3 - 1
-        ast = [
-            AssignmentNode(var_name, IntegerNode(base_value)),
-            AssignmentNode(
-                "result",
-                BinaryOpNode(
-                    IdentifierNode(var_name),
-                    "+",
-                    BinaryOpNode(
-                        BinaryOpNode(IntegerNode(2), "*", IntegerNode(3)),
-                        "-",
-                        IntegerNode(1)
-                    )
-                )
-            )
-        ]
-        
-        # Execute with sandboxed interpreter
-        context_interpreted = ExecutionContext()
-        self.interpreter.execute(ast, context_interpreted)
-        
-        # Execute with optimized executor
-        context_optimized = ExecutionContext()
+        # Complex expression: var = base_value; result = var + 2 * 3 - 1
+        ast = _complex_ast(var_name, base_value)
         code_hash = f"complex_{var_name}_{base_value}"
         
-        metrics = self.optimizer.execute_optimized(code_hash, ast, context_optimized)
-        
-        # Results must be identical
-        interpreted_result = context_interpreted.get_variable("result")
-        optimized_result = context_optimized.get_variable("result")
-        
-        assert optimized_result == interpreted_result, \
-            f"Complex expression mismatch: interpreted={interpreted_result}, optimized={optimized_result}"
-        
-        # Both variables should have same values
-        interpreted_var = context_interpreted.get_variable(var_name)
-        optimized_var = context_optimized.get_variable(var_name)
-        
-        assert optimized_var == interpreted_var, \
-            f"Variable {var_name}: interpreted={interpreted_var}, optimized={optimized_var}"
-        
-        # Optimized execution should be marked as such
-        assert metrics.optimization_applied is True
+        context, _ = self._assert_semantic_equivalence(ast, code_hash)
+        assert context.get_variable("result") == base_value + 5
     
-    @given(st.lists(st.text(alphabet="abcdefghijklmnopqrstuvwxyz", min_size=1, max_size=5), 
-                   min_size=1, max_size=3))
-    @settings(max_examples=15, deadline=2000)
-    def test_print_output_semantic_equivalence(self, var_names):
+    @given(print_programs())
+    @settings(FAST, max_examples=15)
+    def test_print_output_semantic_equivalence(self, program):
         """
         **Feature: aegis, Property 10d: Print Output Semantic Equivalence**
         
@@ -199,48 +330,20 @@ class TestOptimizedExecutorProperties:
         
         **Validates: Requirements 8.4**
         """
-        # Make variable names unique
-        unique_vars = list(set(var_names))
-        assume(len(unique_vars) >= 1)
-        
-        # Create AST: assign values to variables, then print them
-        ast = []
-        expected_values = []
+        # Assign values to distinct variables, then print them
+        ast, unique_vars, expected_values = program
+        code_hash = f"print_{_stable_digest(unique_vars)}"
         
-        for i, var_name in enumerate(unique_vars):
-            value = (i + 1) * 10  # 10, 20, 30, etc.
-            expected_values.append(value)
-            ast.append(AssignmentNode(var_name, IntegerNode(value)))
-            ast.append(PrintNode(var_name))
-        
-        # Execute with sandboxed interpreter
-        context_interpreted = ExecutionContext()
-        self.interpreter.execute(ast, context_interpreted)
-        
-        # Execute with optimized executor
-        context_optimized = ExecutionContext()
-        code_hash = f"print_{hash(tuple(unique_vars))}"
-        
-        metrics = self.optimizer.execute_optimized(code_hash, ast, context_optimized)
-        
-        # Output buffers must be identical
-        interpreted_output = context_interpreted.output_buffer
-        optimized_output = context_optimized.output_buffer
-        
-        assert optimized_output == interpreted_output, \
-            f"Output mismatch: interpreted={interpreted_output}, optimized={optimized_output}"
+        context, _ = self._assert_semantic_equivalence(ast, code_hash)
         
         # Verify expected output content
-        expected_output = [str(val) for val in expected_values]
-        assert interpreted_output == expected_output, \
-            f"Unexpected output: expected={expected_output}, got={interpreted_output}"
-        
-        # Optimized execution should be marked as such
-        assert metrics.optimization_applied is True
+        expected_output = list(map(str, expected_values))
+        assert context.output_buffer == expected_output, \
+            f"Unexpected output: expected={expected_output}, got={context.output_buffer}"
     
     @given(st.integers(min_value=1, max_value=50),
            st.integers(min_value=1, max_value=50))
-    @settings(max_examples=15, deadline=3000)
+    @settings(FAST, max_examples=15)
     def test_simple_program_semantic_equivalence(self, val1, val2):
         """
         **Feature: aegis, Property 10e: Simple Program Semantic Equivalence**
@@ -250,63 +353,15 @@ class TestOptimizedExecutorProperties:
         
         **Validates: Requirements 8.4**
         """
-        # Create a simple but realistic program
-        source = f"""
-        a = {val1}
-        b = {val2}
-        c = a + b
-        d = c * 2
-        print d
-        """
-        
-        try:
-            # Parse the source
-            lexer = Lexer()
-            tokens = lexer.tokenize(source)
-            parser = Parser()
-            ast = parser.parse(tokens)
-            
-            if len(ast) == 0:
-                assume(False)  # Skip empty programs
-            
-        except Exception:
-            assume(False)  # Skip invalid programs
-        
-        # Execute with sandboxed interpreter
-        context_interpreted = ExecutionContext()
-        try:
-            self.interpreter.execute(ast, context_interpreted)
-        except Exception:
-            assume(False)  # Skip programs that fail in interpreter
-        
-        # Execute with optimized executor
-        context_optimized = ExecutionContext()
+        # Simple program with a = val1 and b = val2
+        ast = _simple_program_ast(val1, val2)
         code_hash = f"simple_{val1}_{val2}"
         
-        try:
-            metrics = self.optimizer.execute_optimized(code_hash, ast, context_optimized)
-            
-            # All variables must have identical values
-            for var_name in context_interpreted.variables:
-                interpreted_val = context_interpreted.get_variable(var_name)
-                optimized_val = context_optimized.get_variable(var_name)
-                
-                assert optimized_val == interpreted_val, \
-                    f"Variable {var_name}: interpreted={interpreted_val}, optimized={optimized_val}"
-            
-            # Output must be identical
-            assert context_optimized.output_buffer == context_interpreted.output_buffer, \
-                f"Output mismatch: interpreted={context_interpreted.output_buffer}, " \
-                f"optimized={context_optimized.output_buffer}"
-            
-            # Optimized execution should be marked as such
-            assert metrics.optimization_applied is True
-            
-        except Exception as e:
-            pytest.fail(f"Optimized execution failed where interpreted succeeded: {e}")
+        context, _ = self._assert_semantic_equivalence(ast, code_hash)
+        assert context.output_buffer == [str((val1 + val2) * 2)]
     
     @given(st.integers(min_value=1, max_value=10))
-    @settings(max_examples=20)
+    @settings(FAST, max_examples=20)
     def test_cache_consistency_semantic_equivalence(self, execution_count):
         """
         **Feature: aegis, Property 10f: Cache Consistency Semantic Equivalence**
@@ -326,38 +381,15 @@ class TestOptimizedExecutorProperties:
         
         code_hash = f"cache_consistency_test_{id(self)}_{execution_count}"  # Unique per test
         
-        # Execute multiple times with optimized executor
-        results = []
+        # Execute multiple times with optimized executor; each execution is
+        # checked against the interpreter oracle, which only runs once. The
+        # first execution compiles the code, subsequent ones hit the cache
+        digests = []
         for i in range(execution_count):
-            context = ExecutionContext()
-            metrics = self.optimizer.execute_optimized(code_hash, ast, context)
-            
-            result = {
-                'variables': dict(context.variables),
-                'output': list(context.output_buffer),
-                'cache_hit': metrics.cache_hit
-            }
-            results.append(result)
+            context, _ = self._assert_semantic_equivalence(ast, code_hash, want_hit=i > 0)
+            digests.append(_snapshot_hash(context))
         
         # All results should be identical
-        first_result = results[0]
-        for i, result in enumerate(results[1:], 1):
-            assert result['variables'] == first_result['variables'], \
-                f"Execution {i}: variables differ from first execution"
-            assert result['output'] == first_result['output'], \
-                f"Execution {i}: output differs from first execution"
-        
-        # First execution should not be a cache hit, subsequent ones should be
-        assert results[0]['cache_hit'] is False, "First execution should not be cache hit"
-        if execution_count > 1:
-            for i in range(1, execution_count):
-                assert results[i]['cache_hit'] is True, f"Execution {i} should be cache hit"
-        
-        # Compare with fresh interpreter execution
-        context_interpreted = ExecutionContext()
-        self.interpreter.execute(ast, context_interpreted)
-        
-        assert first_result['variables'] == dict(context_interpreted.variables), \
-            "Optimized results differ from interpreter"
-        assert first_result['output'] == context_interpreted.output_buffer, \
-            "Optimized output differs from interpreter"
\ No newline at end of file
+        for i, digest in enumerate(digests[1:], 1):
+            assert digest == digests[0], \
+                f"Execution {i}: state differs from first execution"
@@ -6,58 +6,112 @@ and handles various syntax constructs and error conditions.
 """
 
 import pytest
-from aegis.lexer import Lexer, Token, TokenType
-from aegis.parser import Parser, ParseError
+from aegis.lexer import Token, TokenType
+from aegis.parser import ParseError
 from aegis.ast import (
     AssignmentNode, BinaryOpNode, IdentifierNode,
-    IntegerNode, PrintNode, ASTPrettyPrinter
+    IntegerNode, PrintNode
 )
 
 
+# Hand-built token streams for error-handling tests. Parser.parse only reads
+# the sequence, so these tuples are shared rather than rebuilt per test.
+
+# Shared end-of-input token for the hand-built streams. The parser only
+# checks the EOF token's type, so one positionless instance ends any stream.
+EOF_TOKEN = Token(TokenType.EOF, "", 0, 0)
+
+# x =
+_TOKENS_MISSING_EXPR = (
+    Token(TokenType.IDENTIFIER, "x", 1, 1),
+    Token(TokenType.ASSIGN, "=", 1, 3),
+    EOF_TOKEN
+)
+
+# print
+_TOKENS_MISSING_PRINT_IDENT = (
+    Token(TokenType.PRINT, "print", 1, 1),
+    EOF_TOKEN
+)
+
+# x = =
+_TOKENS_INVALID_EXPR_START = (
+    Token(TokenType.IDENTIFIER, "x", 1, 1),
+    Token(TokenType.ASSIGN, "=", 1, 3),
+    Token(TokenType.ASSIGN, "=", 1, 5),
+    EOF_TOKEN
+)
+
+# + x
+_TOKENS_UNEXPECTED_STATEMENT = (
+    Token(TokenType.PLUS, "+", 1, 1),
+    Token(TokenType.IDENTIFIER, "x", 1, 3),
+    EOF_TOKEN
+)
+
+# x + (on line 2, where '=' is expected)
+_TOKENS_BAD_POSITION = (
+    Token(TokenType.IDENTIFIER, "x", 2, 5),
+    Token(TokenType.PLUS, "+", 2, 7),  # Invalid - should be =
+    EOF_TOKEN
+)
+
+
+@pytest.fixture
+def first_expr(parsed):
+    """Parse a single assignment and return its expression node."""
+    def parse_first(source):
+        return parsed(source)[1][0].expression
+    return parse_first
+
+
+# The basic statement snippets, batched so they are lexed and parsed once
+_BASIC_SOURCE = "x = 42\ny = x\nprint x"
+
+
+@pytest.fixture
+def basic_ast(parsed):
+    """AST of _BASIC_SOURCE; tests index it by statement position."""
+    _, ast = parsed(_BASIC_SOURCE)
+    assert len(ast) == 3
+    return ast
+
+
 class TestParserBasicStatements:
     """Test parsing of basic statements."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.lexer = Lexer()
-        self.parser = Parser()
-        self.printer = ASTPrettyPrinter()
-    
-    def test_simple_assignment(self):
+    def test_simple_assignment(self, basic_ast):
         """Test parsing simple assignment statements."""
-        tokens = self.lexer.tokenize("x = 42")
-        ast = self.parser.parse(tokens)
+        # x = 42
+        statement = basic_ast[0]
         
-        assert len(ast) == 1
-        assert isinstance(ast[0], AssignmentNode)
-        assert ast[0].identifier == "x"
-        assert isinstance(ast[0].expression, IntegerNode)
-        assert ast[0].expression.value == 42
+        assert isinstance(statement, AssignmentNode)
+        assert statement.identifier == "x"
+        assert isinstance(statement.expression, IntegerNode)
+        assert statement.expression.value == 42
     
-    def test_assignment_with_identifier(self):
+    def test_assignment_with_identifier(self, basic_ast):
         """Test assignment with identifier on right side."""
-        tokens = self.lexer.tokenize("y = x")
-        ast = self.parser.parse(tokens)
+        # y = x
+        statement = basic_ast[1]
         
-        assert len(ast) == 1
-        assert isinstance(ast[0], AssignmentNode)
-        assert ast[0].identifier == "y"
-        assert isinstance(ast[0].expression, IdentifierNode)
-        assert ast[0].expression.name == "x"
+        assert isinstance(statement, AssignmentNode)
+        assert statement.identifier == "y"
+        assert isinstance(statement.expression, IdentifierNode)
+        assert statement.expression.name == "x"
     
-    def test_print_statement(self):
+    def test_print_statement(self, basic_ast):
         """Test parsing print statements."""
-        tokens = self.lexer.tokenize("print x")
-        ast = self.parser.parse(tokens)
+        # print x
+        statement = basic_ast[2]
         
-        assert len(ast) == 1
-        assert isinstance(ast[0], PrintNode)
-        assert ast[0].identifier == "x"
+        assert isinstance(statement, PrintNode)
+        assert statement.identifier == "x"
     
-    def test_empty_program(self):
+    def test_empty_program(self, parser):
         """Test parsing empty program."""
-        tokens = self.lexer.tokenize("")
-        ast = self.parser.parse(tokens)
+        # Tokenizing "" yields only the EOF marker, so build it directly
+        ast = parser.parse([EOF_TOKEN])
         
         assert len(ast) == 0
 
@@ -65,16 +119,15 @@ class TestParserBasicStatements:
 class TestParserArithmeticExpressions:
     """Test parsing of arithmetic expressions."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.lexer = Lexer()
-        self.parser = Parser()
-        self.printer = ASTPrettyPrinter()
-    
-    def test_simple_addition(self):
-        """Test parsing simple addition."""
-        tokens = self.lexer.tokenize("result = 10 + 5")
-        ast = self.parser.parse(tokens)
+    @pytest.mark.parametrize("op,lhs,rhs", [
+        ("+", 10, 5),
+        ("-", 10, 3),
+        ("*", 6, 7),
+        ("/", 20, 4),
+    ])
+    def test_simple_binop(self, parsed, op, lhs, rhs):
+        """Test parsing a single binary operation for each operator."""
+        _, ast = parsed(f"result = {lhs} {op} {rhs}")
         
         assert len(ast) == 1
         assignment = ast[0]
@@ -83,171 +136,72 @@ class TestParserArithmeticExpressions:
         
         expr = assignment.expression
         assert isinstance(expr, BinaryOpNode)
-        assert expr.operator == "+"
+        assert expr.operator == op
         assert isinstance(expr.left, IntegerNode)
-        assert expr.left.value == 10
+        assert expr.left.value == lhs
         assert isinstance(expr.right, IntegerNode)
-        assert expr.right.value == 5
-    
-    def test_simple_subtraction(self):
-        """Test parsing simple subtraction."""
-        tokens = self.lexer.tokenize("result = 10 - 3")
-        ast = self.parser.parse(tokens)
-        
-        assignment = ast[0]
-        expr = assignment.expression
-        assert isinstance(expr, BinaryOpNode)
-        assert expr.operator == "-"
-        assert expr.left.value == 10
-        assert expr.right.value == 3
-    
-    def test_simple_multiplication(self):
-        """Test parsing simple multiplication."""
-        tokens = self.lexer.tokenize("result = 6 * 7")
-        ast = self.parser.parse(tokens)
-        
-        assignment = ast[0]
-        expr = assignment.expression
-        assert isinstance(expr, BinaryOpNode)
-        assert expr.operator == "*"
-        assert expr.left.value == 6
-        assert expr.right.value == 7
-    
-    def test_simple_division(self):
-        """Test parsing simple division."""
-        tokens = self.lexer.tokenize("result = 20 / 4")
-        ast = self.parser.parse(tokens)
-        
-        assignment = ast[0]
-        expr = assignment.expression
-        assert isinstance(expr, BinaryOpNode)
-        assert expr.operator == "/"
-        assert expr.left.value == 20
-        assert expr.right.value == 4
+        assert expr.right.value == rhs
     
-    def test_operator_precedence_multiply_first(self):
+    def test_operator_precedence_multiply_first(self, first_expr):
         """Test that multiplication has higher precedence than addition."""
-        tokens = self.lexer.tokenize("result = 2 + 3 * 4")
-        ast = self.parser.parse(tokens)
-        
-        assignment = ast[0]
-        expr = assignment.expression
-        
         # Should parse as: 2 + (3 * 4)
-        assert isinstance(expr, BinaryOpNode)
-        assert expr.operator == "+"
-        assert isinstance(expr.left, IntegerNode)
-        assert expr.left.value == 2
-        
-        # Right side should be multiplication
-        assert isinstance(expr.right, BinaryOpNode)
-        assert expr.right.operator == "*"
-        assert expr.right.left.value == 3
-        assert expr.right.right.value == 4
+        expected = BinaryOpNode(
+            IntegerNode(2), "+", BinaryOpNode(IntegerNode(3), "*", IntegerNode(4))
+        )
+        assert first_expr("result = 2 + 3 * 4") == expected
     
-    def test_operator_precedence_divide_first(self):
+    def test_operator_precedence_divide_first(self, first_expr):
         """Test that division has higher precedence than subtraction."""
-        tokens = self.lexer.tokenize("result = 10 - 8 / 2")
-        ast = self.parser.parse(tokens)
-        
-        assignment = ast[0]
-        expr = assignment.expression
-        
         # Should parse as: 10 - (8 / 2)
-        assert isinstance(expr, BinaryOpNode)
-        assert expr.operator == "-"
-        assert expr.left.value == 10
-        assert isinstance(expr.right, BinaryOpNode)
-        assert expr.right.operator == "/"
-        assert expr.right.left.value == 8
-        assert expr.right.right.value == 2
+        expected = BinaryOpNode(
+            IntegerNode(10), "-", BinaryOpNode(IntegerNode(8), "/", IntegerNode(2))
+        )
+        assert first_expr("result = 10 - 8 / 2") == expected
     
-    def test_left_associativity_addition(self):
+    def test_left_associativity_addition(self, first_expr):
         """Test that addition is left-associative."""
-        tokens = self.lexer.tokenize("result = 1 + 2 + 3")
-        ast = self.parser.parse(tokens)
-        
-        assignment = ast[0]
-        expr = assignment.expression
-        
-        # Should parse as: (1 + 2) + 3
-        assert isinstance(expr, BinaryOpNode)
-        assert expr.operator == "+"
-        assert expr.right.value == 3
-        
-        # Left side should be another addition
-        assert isinstance(expr.left, BinaryOpNode)
-        assert expr.left.operator == "+"
-        assert expr.left.left.value == 1
-        assert expr.left.right.value == 2
-    
-    def test_left_associativity_multiplication(self):
+        # Should parse as: (1 + 2) + 3. The printer omits parentheses for
+        # either grouping of +, so compare the tree itself
+        expected = BinaryOpNode(
+            BinaryOpNode(IntegerNode(1), "+", IntegerNode(2)), "+", IntegerNode(3)
+        )
+        assert first_expr("result = 1 + 2 + 3") == expected
+    
+    def test_left_associativity_multiplication(self, first_expr):
         """Test that multiplication is left-associative."""
-        tokens = self.lexer.tokenize("result = 2 * 3 * 4")
-        ast = self.parser.parse(tokens)
-        
-        assignment = ast[0]
-        expr = assignment.expression
-        
         # Should parse as: (2 * 3) * 4
-        assert isinstance(expr, BinaryOpNode)
-        assert expr.operator == "*"
-        assert expr.right.value == 4
-        assert isinstance(expr.left, BinaryOpNode)
-        assert expr.left.operator == "*"
-        assert expr.left.left.value == 2
-        assert expr.left.right.value == 3
+        expected = BinaryOpNode(
+            BinaryOpNode(IntegerNode(2), "*", IntegerNode(3)), "*", IntegerNode(4)
+        )
+        assert first_expr("result = 2 * 3 * 4") == expected
     
-    def test_complex_expression(self):
+    def test_complex_expression(self, first_expr, printer):
         """Test parsing complex expressions with mixed operators."""
-        tokens = self.lexer.tokenize("result = 1 + 2 * 3 - 4 / 2")
-        ast = self.parser.parse(tokens)
-        
-        assignment = ast[0]
-        expr = assignment.expression
-        
         # Should parse as: ((1 + (2 * 3)) - (4 / 2))
         # Verify the structure by pretty-printing
-        pretty = self.printer.print_ast(expr)
+        pretty = printer.print_ast(first_expr("result = 1 + 2 * 3 - 4 / 2"))
         assert "1 + 2 * 3 - 4 / 2" == pretty
     
-    def test_expression_with_variables(self):
+    def test_expression_with_variables(self, first_expr):
         """Test expressions with variable references."""
-        tokens = self.lexer.tokenize("result = x + y * z")
-        ast = self.parser.parse(tokens)
-        
-        assignment = ast[0]
-        expr = assignment.expression
-        
-        assert isinstance(expr, BinaryOpNode)
-        assert expr.operator == "+"
-        assert isinstance(expr.left, IdentifierNode)
-        assert expr.left.name == "x"
-        
-        # Right side should be y * z
-        assert isinstance(expr.right, BinaryOpNode)
-        assert expr.right.operator == "*"
-        assert expr.right.left.name == "y"
-        assert expr.right.right.name == "z"
+        # Should parse as: x + (y * z)
+        expected = BinaryOpNode(
+            IdentifierNode("x"), "+",
+            BinaryOpNode(IdentifierNode("y"), "*", IdentifierNode("z"))
+        )
+        assert first_expr("result = x + y * z") == expected
 
 
 class TestParserMultipleStatements:
     """Test parsing programs with multiple statements."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.lexer = Lexer()
-        self.parser = Parser()
-        self.printer = ASTPrettyPrinter()
-    
-    def test_multiple_assignments(self):
+    def test_multiple_assignments(self, parsed):
         """Test parsing multiple assignment statements."""
         source = """x = 10
 y = 20
 z = x + y"""
         
-        tokens = self.lexer.tokenize(source)
-        ast = self.parser.parse(tokens)
+        _, ast = parsed(source)
         
         assert len(ast) == 3
         
@@ -266,20 +220,19 @@ z = x + y"""
         assert ast[2].identifier == "z"
         assert isinstance(ast[2].expression, BinaryOpNode)
     
-    def test_assignment_and_print(self):
+    def test_assignment_and_print(self, parsed):
         """Test parsing assignment followed by print."""
         source = """result = 42
 print result"""
         
-        tokens = self.lexer.tokenize(source)
-        ast = self.parser.parse(tokens)
+        _, ast = parsed(source)
         
         assert len(ast) == 2
         assert isinstance(ast[0], AssignmentNode)
         assert isinstance(ast[1], PrintNode)
         assert ast[1].identifier == "result"
     
-    def test_complete_program(self):
+    def test_complete_program(self, parsed):
         """Test parsing a complete AEGIS program."""
         source = """x = 10
 y = 20
@@ -288,8 +241,7 @@ product = x * y
 print sum
 print product"""
         
-        tokens = self.lexer.tokenize(source)
-        ast = self.parser.parse(tokens)
+        _, ast = parsed(source)
         
         assert len(ast) == 6
         
@@ -302,7 +254,7 @@ print product"""
         for i, expected_type in enumerate(expected_types):
             assert isinstance(ast[i], expected_type)
     
-    def test_program_with_empty_lines(self):
+    def test_program_with_empty_lines(self, parsed):
         """Test parsing program with empty lines (multiple newlines)."""
         source = """x = 10
 
@@ -311,8 +263,7 @@ y = 20
 
 print x"""
         
-        tokens = self.lexer.tokenize(source)
-        ast = self.parser.parse(tokens)
+        _, ast = parsed(source)
         
         # Should ignore empty lines and parse 3 statements
         assert len(ast) == 3
@@ -324,86 +275,47 @@ print x"""
 class TestParserErrorHandling:
     """Test parser error handling and syntax error detection."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.lexer = Lexer()
-        self.parser = Parser()
-    
-    def test_missing_assignment_operator(self):
+    def test_missing_assignment_operator(self, tokenize_cached, parser):
         """Test error when assignment operator is missing."""
-        tokens = self.lexer.tokenize("x 42")
-        
-        with pytest.raises(ParseError) as exc_info:
-            self.parser.parse(tokens)
+        tokens = tokenize_cached("x 42")
         
-        assert "Expected '='" in str(exc_info.value)
+        with pytest.raises(ParseError, match=r"Expected '='"):
+            parser.parse(tokens)
     
-    def test_missing_expression_after_assignment(self):
+    def test_missing_expression_after_assignment(self, parser):
         """Test error when expression is missing after assignment."""
-        # Create tokens manually to simulate incomplete assignment
-        tokens = [
-            Token(TokenType.IDENTIFIER, "x", 1, 1),
-            Token(TokenType.ASSIGN, "=", 1, 3),
-            Token(TokenType.EOF, "", 1, 4)
-        ]
-        
-        with pytest.raises(ParseError) as exc_info:
-            self.parser.parse(tokens)
+        tokens = _TOKENS_MISSING_EXPR
         
-        assert "Expected expression" in str(exc_info.value)
+        with pytest.raises(ParseError, match=r"Expected expression"):
+            parser.parse(tokens)
     
-    def test_missing_identifier_after_print(self):
+    def test_missing_identifier_after_print(self, parser):
         """Test error when identifier is missing after print."""
-        # Create tokens manually
-        tokens = [
-            Token(TokenType.PRINT, "print", 1, 1),
-            Token(TokenType.EOF, "", 1, 6)
-        ]
+        tokens = _TOKENS_MISSING_PRINT_IDENT
         
-        with pytest.raises(ParseError) as exc_info:
-            self.parser.parse(tokens)
-        
-        assert "Expected identifier after 'print'" in str(exc_info.value)
+        with pytest.raises(ParseError, match=r"Expected identifier after 'print'"):
+            parser.parse(tokens)
     
-    def test_invalid_expression_start(self):
+    def test_invalid_expression_start(self, parser):
         """Test error when expression starts with invalid token."""
-        # Create tokens for: x = =
-        tokens = [
-            Token(TokenType.IDENTIFIER, "x", 1, 1),
-            Token(TokenType.ASSIGN, "=", 1, 3),
-            Token(TokenType.ASSIGN, "=", 1, 5),
-            Token(TokenType.EOF, "", 1, 6)
-        ]
+        tokens = _TOKENS_INVALID_EXPR_START
         
-        with pytest.raises(ParseError) as exc_info:
-            self.parser.parse(tokens)
-        
-        assert "Expected expression" in str(exc_info.value)
+        with pytest.raises(ParseError, match=r"Expected expression"):
+            parser.parse(tokens)
     
-    def test_unexpected_token_at_statement_level(self):
+    def test_unexpected_token_at_statement_level(self, parser):
         """Test error when unexpected token appears at statement level."""
-        # Create tokens for: + x
-        tokens = [
-            Token(TokenType.PLUS, "+", 1, 1),
-            Token(TokenType.IDENTIFIER, "x", 1, 3),
-            Token(TokenType.EOF, "", 1, 4)
-        ]
+        tokens = _TOKENS_UNEXPECTED_STATEMENT
         
-        with pytest.raises(ParseError) as exc_info:
-            self.parser.parse(tokens)
-        
-        assert "Unexpected token" in str(exc_info.value)
+        with pytest.raises(ParseError, match=r"Unexpected token"):
+            parser.parse(tokens)
     
-    def test_error_position_reporting(self):
+    def test_error_position_reporting(self, parser):
         """Test that parse errors include correct position information."""
-        tokens = [
-            Token(TokenType.IDENTIFIER, "x", 2, 5),
-            Token(TokenType.PLUS, "+", 2, 7),  # Invalid - should be =
-            Token(TokenType.EOF, "", 2, 8)
-        ]
+        tokens = _TOKENS_BAD_POSITION
         
         with pytest.raises(ParseError) as exc_info:
-            self.parser.parse(tokens)
+            parser.parse(tokens)
         
         error = exc_info.value
         assert error.token.line == 2
@@ -413,60 +325,52 @@ class TestParserErrorHandling:
 class TestParserRoundTrip:
     """Test that parsing and pretty-printing produces equivalent programs."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.lexer = Lexer()
-        self.parser = Parser()
-        self.printer = ASTPrettyPrinter()
+    @staticmethod
+    def assert_roundtrip(source, parsed, printer, tokenize_cached):
+        """
+        Assert that pretty-printing the parsed source reproduces it.
+        
+        The printed program is re-lexed and its token stream compared with
+        the original's before the text itself, so a structural difference
+        is reported as a token mismatch rather than only a string diff.
+        """
+        tokens, ast = parsed(source)
+        reconstructed = printer.print_program(ast)
+        
+        def token_stream(stream):
+            return [(token.type, token.value) for token in stream]
+        
+        assert token_stream(tokenize_cached(reconstructed)) == token_stream(tokens)
+        assert reconstructed == source
     
-    def test_simple_assignment_roundtrip(self):
+    def test_simple_assignment_roundtrip(self, parsed, printer, tokenize_cached):
         """Test round-trip for simple assignment."""
         source = "x = 42"
         
-        tokens = self.lexer.tokenize(source)
-        ast = self.parser.parse(tokens)
-        reconstructed = self.printer.print_program(ast)
-        
-        assert reconstructed == source
+        self.assert_roundtrip(source, parsed, printer, tokenize_cached)
     
-    def test_arithmetic_expression_roundtrip(self):
+    def test_arithmetic_expression_roundtrip(self, parsed, printer, tokenize_cached):
         """Test round-trip for arithmetic expressions."""
         source = "result = 1 + 2 * 3"
         
-        tokens = self.lexer.tokenize(source)
-        ast = self.parser.parse(tokens)
-        reconstructed = self.printer.print_program(ast)
-        
-        assert reconstructed == source
+        self.assert_roundtrip(source, parsed, printer, tokenize_cached)
     
-    def test_print_statement_roundtrip(self):
+    def test_print_statement_roundtrip(self, parsed, printer, tokenize_cached):
         """Test round-trip for print statements."""
         source = "print x"
         
-        tokens = self.lexer.tokenize(source)
-        ast = self.parser.parse(tokens)
-        reconstructed = self.printer.print_program(ast)
-        
-        assert reconstructed == source
+        self.assert_roundtrip(source, parsed, printer, tokenize_cached)
     
-    def test_complete_program_roundtrip(self):
+    def test_complete_program_roundtrip(self, parsed, printer, tokenize_cached):
         """Test round-trip for complete program."""
         source = """x = 10
 y = x + 5
 print y"""
         
-        tokens = self.lexer.tokenize(source)
-        ast = self.parser.parse(tokens)
-        reconstructed = self.printer.print_program(ast)
-        
-        assert reconstructed == source
+        self.assert_roundtrip(source, parsed, printer, tokenize_cached)
     
-    def test_complex_expression_roundtrip(self):
+    def test_complex_expression_roundtrip(self, parsed, printer, tokenize_cached):
         """Test round-trip for complex expressions."""
         source = "result = a + b * c - d / e"
         
-        tokens = self.lexer.tokenize(source)
-        ast = self.parser.parse(tokens)
-        reconstructed = self.printer.print_program(ast)
-        
-        assert reconstructed == source
\ No newline at end of file
+        self.assert_roundtrip(source, parsed, printer, tokenize_cached)
\ No newline at end of file
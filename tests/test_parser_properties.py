@@ -5,271 +5,161 @@ These tests use Hypothesis to generate random valid AEGIS programs
 and verify universal properties that should hold for all valid programs.
 """
 
+import operator
+import string
+
 import pytest
-from hypothesis import given, strategies as st, assume
-from aegis.lexer import Lexer, LexerError
-from aegis.parser import Parser, ParseError
+from hypothesis import given, strategies as st, settings, target, Phase, HealthCheck
+from aegis.lexer import LexerError
+from aegis.parser import ParseError
 from aegis.ast import ASTPrettyPrinter
 
 
-# Strategy for generating valid AEGIS identifiers (reused from lexer tests)
-@st.composite
-def valid_identifier(draw):
-    """Generate valid AEGIS identifiers."""
-    # Start with letter or underscore
-    first_char = draw(st.one_of(
-        st.characters(min_codepoint=ord('a'), max_codepoint=ord('z')),
-        st.characters(min_codepoint=ord('A'), max_codepoint=ord('Z')),
-        st.just('_')
-    ))
-    
-    # Continue with letters, digits, or underscores
-    rest_chars = draw(st.text(
-        alphabet=st.characters(
-            min_codepoint=ord('a'), max_codepoint=ord('z')
-        ) | st.characters(
-            min_codepoint=ord('A'), max_codepoint=ord('Z')
-        ) | st.characters(
-            min_codepoint=ord('0'), max_codepoint=ord('9')
-        ) | st.just('_'),
-        max_size=15
-    ))
-    
-    identifier = first_char + rest_chars
-    
-    # Ensure it's not a keyword
-    assume(identifier != 'print')
-    
-    return identifier
+# Parser properties are cheap to check but slow to explain and shrink, so
+# skip the explain phase and run a fixed, smaller example budget
+PARSER = settings(
+    max_examples=50,
+    derandomize=True,
+    phases=[Phase.explicit, Phase.reuse, Phase.generate, Phase.target, Phase.shrink],
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+
+
+# Strategy for generating valid AEGIS identifiers (reused from lexer tests):
+# a letter or underscore followed by letters, digits or underscores. The
+# component strategies are built once and shared by every draw
+_KEYWORDS = frozenset({'print'})
+_IDENTIFIER_START = st.sampled_from(string.ascii_letters + '_')
+_IDENTIFIER_REST = st.text(alphabet=string.ascii_letters + string.digits + '_', max_size=7)
+valid_identifier = st.builds(operator.add, _IDENTIFIER_START, _IDENTIFIER_REST).map(
+    # Steer keywords to a valid identifier rather than discarding the draw
+    lambda identifier: identifier + '_' if identifier in _KEYWORDS else identifier
+)
 
 
 # Strategy for generating valid integers
-valid_integer = st.integers(min_value=0, max_value=9999)
+valid_integer = st.integers(min_value=0, max_value=255)
 
 
 # Strategy for generating arithmetic operators
 arithmetic_operator = st.sampled_from(['+', '-', '*', '/'])
 
 
-# Strategy for generating simple expressions
-@st.composite
-def simple_expression(draw):
-    """Generate simple arithmetic expressions."""
-    choice = draw(st.integers(min_value=1, max_value=3))
-    
-    if choice == 1:
-        # Just an integer
-        return str(draw(valid_integer))
-    elif choice == 2:
-        # Just an identifier
-        return draw(valid_identifier())
-    else:
-        # Binary operation: left op right
-        left = draw(st.one_of(
-            valid_integer.map(str),
-            valid_identifier()
-        ))
-        operator = draw(arithmetic_operator)
-        right = draw(st.one_of(
-            valid_integer.map(str),
-            valid_identifier()
-        ))
-        return f"{left} {operator} {right}"
+# Strategy for generating simple expressions: an integer, an identifier,
+# or a single binary operation between two of those
+_operand = valid_integer.map(str) | valid_identifier
+simple_expression = st.one_of(
+    valid_integer.map(str),
+    valid_identifier,
+    st.builds("{} {} {}".format, _operand, arithmetic_operator, _operand)
+)
 
 
 # Strategy for generating assignment statements
-@st.composite
-def assignment_statement(draw):
-    """Generate assignment statements."""
-    identifier = draw(valid_identifier())
-    expression = draw(simple_expression())
-    return f"{identifier} = {expression}"
+assignment_statement = st.builds("{} = {}".format, valid_identifier, simple_expression)
 
 
 # Strategy for generating print statements
-@st.composite
-def print_statement(draw):
-    """Generate print statements."""
-    identifier = draw(valid_identifier())
-    return f"print {identifier}"
+print_statement = valid_identifier.map("print {}".format)
 
 
 # Strategy for generating single statements
-@st.composite
-def single_statement(draw):
-    """Generate a single AEGIS statement."""
-    choice = draw(st.integers(min_value=1, max_value=2))
-    
-    if choice == 1:
-        return draw(assignment_statement())
-    else:
-        return draw(print_statement())
+single_statement = assignment_statement | print_statement
 
 
-# Strategy for generating programs (multiple statements)
-@st.composite
-def aegis_program(draw):
-    """Generate complete AEGIS programs."""
-    statements = draw(st.lists(single_statement(), min_size=1, max_size=5))
-    return '\n'.join(statements)
+# Strategy for generating programs (multiple statements) as pre-joined
+# (source, statement_count) pairs
+aegis_program = st.lists(single_statement, min_size=1, max_size=3).map(
+    lambda statements: ('\n'.join(statements), len(statements))
+)
 
 
+def _chain_assignment(identifiers, op):
+    """Build `result = id1 op id2 op ...` from a list of identifiers."""
+    return f"result = {f' {op} '.join(identifiers)}"
+
+
+# Printable ASCII (codepoints 32-126) for the crash-resistance property,
+# sampled directly rather than through a codepoint-range character strategy
+_PRINTABLE_ALPHABET = st.sampled_from([chr(c) for c in range(32, 127)])
+
+
+def _one_statement(source):
+    """Pair a single-statement source with its statement count."""
+    return source, 1
+
+
+# Strategy covering every round-trip shape as (source, statement_count):
+# single assignments and prints, mixed programs, bare expressions and
+# left-associative operator chains
+roundtrip_source = st.one_of(
+    assignment_statement.map(_one_statement),
+    print_statement.map(_one_statement),
+    aegis_program,
+    simple_expression.map("result = {}".format).map(_one_statement),
+    st.builds(
+        _chain_assignment,
+        st.lists(valid_identifier, min_size=2, max_size=4),
+        arithmetic_operator
+    ).map(_one_statement)
+)
+
+
+@pytest.mark.xdist_group(name="parser_props")
 class TestParserProperties:
     """Property-based tests for parser correctness."""
     
+    # Stateless across calls, so one instance serves every example
+    printer = ASTPrettyPrinter()
+    
     def setup_method(self):
-        """Set up test fixtures."""
-        self.lexer = Lexer()
-        self.parser = Parser()
-        self.printer = ASTPrettyPrinter()
+        """Set up the pretty-print memo for this test."""
+        # id(ast) -> (ast, text); holding ast keeps its id from being reused.
+        # Parsed ASTs come from the session parsed cache, so repeated sources across
+        # examples hand back the same objects and hit here
+        self._pretty_cache = {}
     
-    @given(assignment_statement())
-    def test_assignment_parsing_roundtrip(self, assignment):
-        """
-        **Feature: aegis, Property 2: Parsing Round-Trip Consistency**
-        
-        For any valid assignment statement, parsing and then pretty-printing
-        should produce a semantically equivalent program.
-        
-        **Validates: Requirements 3.5**
-        """
-        try:
-            # Parse the assignment
-            tokens = self.lexer.tokenize(assignment)
-            ast = self.parser.parse(tokens)
-            
-            # Should have exactly one statement
-            assert len(ast) == 1
-            
-            # Pretty-print back to source
-            reconstructed = self.printer.print_program(ast)
-            
-            # Parse the reconstructed version
-            tokens2 = self.lexer.tokenize(reconstructed)
-            ast2 = self.parser.parse(tokens2)
-            
-            # Should produce the same AST structure
-            assert len(ast) == len(ast2)
-            
-            # Compare the pretty-printed versions (should be identical)
-            reconstructed2 = self.printer.print_program(ast2)
-            assert reconstructed == reconstructed2
-            
-        except (LexerError, ParseError):
-            # If parsing fails, the generated statement might be invalid
-            # This is acceptable for property testing
-            pass
+    def print_program(self, ast):
+        """ASTPrettyPrinter.print_program, memoized by AST identity."""
+        entry = self._pretty_cache.get(id(ast))
+        if entry is None or entry[0] is not ast:
+            entry = (ast, self.printer.print_program(ast))
+            self._pretty_cache[id(ast)] = entry
+        return entry[1]
     
-    @given(print_statement())
-    def test_print_parsing_roundtrip(self, print_stmt):
+    @given(roundtrip_source)
+    @settings(PARSER)
+    def test_parsing_roundtrip(self, parsed, example):
         """
         **Feature: aegis, Property 2: Parsing Round-Trip Consistency**
         
-        For any valid print statement, parsing and then pretty-printing
-        should produce a semantically equivalent program.
+        For any valid AEGIS program, parsing and then pretty-printing
+        should produce a program that parses back to the same AST,
+        respecting operator precedence and associativity.
         
-        **Validates: Requirements 3.5**
+        **Validates: Requirements 3.4, 3.5**
         """
-        try:
-            # Parse the print statement
-            tokens = self.lexer.tokenize(print_stmt)
-            ast = self.parser.parse(tokens)
-            
-            # Should have exactly one statement
-            assert len(ast) == 1
-            
-            # Pretty-print back to source
-            reconstructed = self.printer.print_program(ast)
-            
-            # Parse the reconstructed version
-            tokens2 = self.lexer.tokenize(reconstructed)
-            ast2 = self.parser.parse(tokens2)
-            
-            # Should produce the same AST structure
-            assert len(ast) == len(ast2)
-            
-            # Compare the pretty-printed versions
-            reconstructed2 = self.printer.print_program(ast2)
-            assert reconstructed == reconstructed2
-            
-        except (LexerError, ParseError):
-            # If parsing fails, the statement might be invalid
-            pass
-    
-    @given(simple_expression())
-    def test_expression_parsing_consistency(self, expression):
-        """
-        **Feature: aegis, Property 2: Parsing Round-Trip Consistency**
+        source, statement_count = example
         
-        For any valid expression in an assignment, parsing should
-        preserve the expression structure correctly.
+        # The strategies only compose valid building blocks, so every drawn
+        # program must parse; a LexerError or ParseError here is a failure
+        _, ast = parsed(source)
+        assert len(ast) == statement_count
         
-        **Validates: Requirements 3.5**
-        """
-        try:
-            # Wrap expression in an assignment
-            assignment = f"result = {expression}"
-            
-            tokens = self.lexer.tokenize(assignment)
-            ast = self.parser.parse(tokens)
-            
-            # Should have one assignment
-            assert len(ast) == 1
-            
-            # Extract and pretty-print the expression
-            expr_node = ast[0].expression
-            expr_pretty = self.printer.print_ast(expr_node)
-            
-            # Parse the expression again in a new assignment
-            assignment2 = f"result = {expr_pretty}"
-            tokens2 = self.lexer.tokenize(assignment2)
-            ast2 = self.parser.parse(tokens2)
-            
-            # Expression should be structurally equivalent
-            expr_node2 = ast2[0].expression
-            expr_pretty2 = self.printer.print_ast(expr_node2)
-            
-            assert expr_pretty == expr_pretty2
-            
-        except (LexerError, ParseError):
-            # If parsing fails, the expression might be invalid
-            pass
-    
-    @given(aegis_program())
-    def test_program_parsing_roundtrip(self, program):
-        """
-        **Feature: aegis, Property 2: Parsing Round-Trip Consistency**
+        # Steer the target phase towards longer multi-statement programs
+        target(float(len(ast)), label="statements")
         
-        For any valid AEGIS program, parsing and then pretty-printing
-        should produce a semantically equivalent program.
+        # Pretty-print back to source and parse the reconstructed version
+        reconstructed = self.print_program(ast)
+        _, ast2 = parsed(reconstructed)
         
-        **Validates: Requirements 3.5**
-        """
-        try:
-            # Parse the program
-            tokens = self.lexer.tokenize(program)
-            ast = self.parser.parse(tokens)
-            
-            # Pretty-print back to source
-            reconstructed = self.printer.print_program(ast)
-            
-            # Parse the reconstructed version
-            tokens2 = self.lexer.tokenize(reconstructed)
-            ast2 = self.parser.parse(tokens2)
-            
-            # Should have the same number of statements
-            assert len(ast) == len(ast2)
-            
-            # Compare the pretty-printed versions
-            reconstructed2 = self.printer.print_program(ast2)
-            assert reconstructed == reconstructed2
-            
-        except (LexerError, ParseError):
-            # If parsing fails, the program might be invalid
-            pass
+        # Should produce the same AST structure
+        assert ast2 == ast
     
-    @given(st.text(alphabet=st.characters(min_codepoint=32, max_codepoint=126), max_size=100))
-    def test_parser_never_crashes(self, arbitrary_text):
+    @given(st.text(alphabet=_PRINTABLE_ALPHABET, max_size=40))
+    @settings(PARSER)
+    def test_parser_never_crashes(self, parsed, arbitrary_text):
         """
         **Feature: aegis, Property 2: Parsing Round-Trip Consistency**
         
@@ -279,132 +169,10 @@ class TestParserProperties:
         **Validates: Requirements 3.2**
         """
         try:
-            tokens = self.lexer.tokenize(arbitrary_text)
-            ast = self.parser.parse(tokens)
+            _, ast = parsed(arbitrary_text)
             # If successful, should return a list
             assert isinstance(ast, list)
         except (LexerError, ParseError):
-            # These errors are acceptable for invalid input
-            pass
-        except Exception as e:
-            # Any other exception is a bug
-            pytest.fail(f"Parser crashed with unexpected exception: {e}")
-    
-    @given(st.lists(assignment_statement(), min_size=1, max_size=5))
-    def test_multiple_assignments_roundtrip(self, assignments):
-        """
-        **Feature: aegis, Property 2: Parsing Round-Trip Consistency**
-        
-        For any sequence of valid assignment statements, parsing should
-        preserve all statements correctly.
-        
-        **Validates: Requirements 3.5**
-        """
-        try:
-            # Join assignments with newlines
-            program = '\n'.join(assignments)
-            
-            tokens = self.lexer.tokenize(program)
-            ast = self.parser.parse(tokens)
-            
-            # Should have same number of statements as input
-            assert len(ast) == len(assignments)
-            
-            # Pretty-print and re-parse
-            reconstructed = self.printer.print_program(ast)
-            tokens2 = self.lexer.tokenize(reconstructed)
-            ast2 = self.parser.parse(tokens2)
-            
-            # Should maintain the same structure
-            assert len(ast) == len(ast2)
-            
-            # Each statement should be preserved
-            for i in range(len(ast)):
-                stmt1_pretty = self.printer.print_ast(ast[i])
-                stmt2_pretty = self.printer.print_ast(ast2[i])
-                assert stmt1_pretty == stmt2_pretty
-                
-        except (LexerError, ParseError):
-            # If parsing fails, some assignment might be invalid
+            # These errors are acceptable for invalid input; any other
+            # exception propagates and fails the test as a crash
             pass
-    
-    @given(arithmetic_operator, valid_integer, valid_integer)
-    def test_operator_precedence_consistency(self, op1, left, right):
-        """
-        **Feature: aegis, Property 2: Parsing Round-Trip Consistency**
-        
-        For any arithmetic operation, parsing should respect operator
-        precedence and associativity rules consistently.
-        
-        **Validates: Requirements 3.4**
-        """
-        try:
-            # Create a simple binary operation
-            expression = f"{left} {op1} {right}"
-            assignment = f"result = {expression}"
-            
-            tokens = self.lexer.tokenize(assignment)
-            ast = self.parser.parse(tokens)
-            
-            # Should parse successfully
-            assert len(ast) == 1
-            
-            # Extract the expression and verify structure
-            expr_node = ast[0].expression
-            expr_pretty = self.printer.print_ast(expr_node)
-            
-            # Re-parse and verify consistency
-            assignment2 = f"result = {expr_pretty}"
-            tokens2 = self.lexer.tokenize(assignment2)
-            ast2 = self.parser.parse(tokens2)
-            
-            expr_node2 = ast2[0].expression
-            expr_pretty2 = self.printer.print_ast(expr_node2)
-            
-            # Should be identical
-            assert expr_pretty == expr_pretty2
-            
-        except (LexerError, ParseError):
-            # If parsing fails, the operation might be invalid
-            pass
-    
-    @given(st.lists(valid_identifier(), min_size=2, max_size=4), arithmetic_operator)
-    def test_complex_expression_roundtrip(self, identifiers, operator):
-        """
-        **Feature: aegis, Property 2: Parsing Round-Trip Consistency**
-        
-        For any complex expression with multiple variables, parsing
-        should preserve the expression structure correctly.
-        
-        **Validates: Requirements 3.5**
-        """
-        try:
-            # Create a chain of operations: id1 op id2 op id3 ...
-            if len(identifiers) < 2:
-                return
-            
-            expression_parts = [identifiers[0]]
-            for i in range(1, len(identifiers)):
-                expression_parts.extend([operator, identifiers[i]])
-            
-            expression = ' '.join(expression_parts)
-            assignment = f"result = {expression}"
-            
-            tokens = self.lexer.tokenize(assignment)
-            ast = self.parser.parse(tokens)
-            
-            # Should parse successfully
-            assert len(ast) == 1
-            
-            # Pretty-print and re-parse
-            reconstructed = self.printer.print_program(ast)
-            tokens2 = self.lexer.tokenize(reconstructed)
-            ast2 = self.parser.parse(tokens2)
-            
-            # Should maintain structure
-            reconstructed2 = self.printer.print_program(ast2)
-            assert reconstructed == reconstructed2
-            
-        except (LexerError, ParseError):
-            # If parsing fails, the expression might be invalid
-            pass
\ No newline at end of file
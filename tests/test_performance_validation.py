@@ -6,11 +6,12 @@ trust score calculation accuracy, and rollback performance across the
 complete AEGIS system.
 """
 
+import bisect
+import logging
 import pytest
 import time
 import tempfile
 import os
-from statistics import mean, stdev
 from aegis.pipeline import AegisExecutionPipeline
 from aegis.trust.trust_manager import TrustManager
 from aegis.runtime.monitor import RuntimeMonitor
@@ -18,25 +19,63 @@ from aegis.compiler.optimizer import OptimizedExecutor
 from aegis.compiler.cache import CodeCache
 
 
-class TestPerformanceValidation:
-    """Performance validation tests for AEGIS system."""
+# Measurements are reported at DEBUG so they cost nothing in normal runs;
+# show them with: pytest --log-cli-level=DEBUG
+log = logging.getLogger(__name__)
+
+
+def _mean(values):
+    """Arithmetic mean of a non-empty sequence of numbers."""
+    return sum(values) / len(values)
+
+
+# Programs whose trust progression is checked independently
+_TRUST_PROGRAMS = [
+    "x = 5\nprint x",
+    "y = 10\nz = y * 2\nprint z",
+    "a = 3\nb = 7\nsum = a + b\nprint sum"
+]
+
+# Valid program used as the baseline for error handling performance
+_VALID_PROGRAM = "x = 10\ny = 20\nresult = x + y\nprint result"
+
+
+@pytest.fixture
+def trust_file(tmp_path):
+    """Trust file path private to one test."""
+    return str(tmp_path / "trust.json")
+
+
+@pytest.fixture
+def pipeline(trust_file):
+    """
+    Pipeline private to one test.
     
-    def setup_method(self):
-        """Set up test environment with temporary trust file."""
-        # Create temporary trust file
-        self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.json')
-        self.temp_file.close()
-        self.trust_file = self.temp_file.name
-        
-        # Initialize pipeline
-        self.pipeline = AegisExecutionPipeline(trust_file=self.trust_file)
+    Tests share no pipeline, trust file or global state, so they can run
+    in parallel under pytest-xdist (pytest -n auto).
+    """
+    return AegisExecutionPipeline(trust_file=trust_file)
+
+
+@pytest.fixture
+def baseline_valid_time(pipeline):
+    """Average execution time in seconds of _VALID_PROGRAM on the test's pipeline."""
+    valid_times = [0] * 10
+    for i in range(10):
+        t0 = time.perf_counter_ns()
+        result = pipeline.execute(_VALID_PROGRAM)
+        elapsed_ns = time.perf_counter_ns() - t0
+        
+        assert result.success
+        valid_times[i] = elapsed_ns
     
-    def teardown_method(self):
-        """Clean up test environment."""
-        if os.path.exists(self.trust_file):
-            os.unlink(self.trust_file)
+    return _mean(valid_times) / 1e9
+
+
+class TestPerformanceValidation:
+    """Performance validation tests for AEGIS system."""
     
-    def test_interpreter_vs_optimized_execution_performance(self):
+    def test_interpreter_vs_optimized_execution_performance(self, pipeline):
         """Test performance difference between interpreted and optimized execution."""
         # Complex computation program
         program = """
@@ -51,103 +90,97 @@ class TestPerformanceValidation:
         print result4
         """
         
+        # Distinct outputs seen across every execution, in either mode
+        outputs = set()
+        
         # Measure interpreted execution times
-        interpreted_times = []
+        interpreted_times = [0] * 5
         for i in range(5):
-            start_time = time.time()
-            result = self.pipeline.execute(program)
-            end_time = time.time()
+            t0 = time.perf_counter_ns()
+            result = pipeline.execute(program)
+            elapsed_ns = time.perf_counter_ns() - t0
             
             assert result.success
             assert result.execution_mode == 'sandboxed'
-            interpreted_times.append(end_time - start_time)
+            interpreted_times[i] = elapsed_ns
+            outputs.add(tuple(result.output))
         
         # Build trust for optimization
-        for i in range(10):
-            result = self.pipeline.execute(program)
-            assert result.success
+        results = pipeline.execute_many(program, 10)
+        assert all(result.success for result in results)
+        
+        # Warm up the optimizer so the timed runs exclude first-compile and
+        # cache-fill cost and reflect steady-state optimized execution
+        results = pipeline.execute_many(program, 2)
+        assert all(result.execution_mode == 'optimized' for result in results)
         
         # Measure optimized execution times
-        optimized_times = []
+        optimized_times = [0] * 5
         optimized_speedups = []
         for i in range(5):
-            start_time = time.time()
-            result = self.pipeline.execute(program)
-            end_time = time.time()
+            t0 = time.perf_counter_ns()
+            result = pipeline.execute(program)
+            elapsed_ns = time.perf_counter_ns() - t0
             
             assert result.success
-            optimized_times.append(end_time - start_time)
+            optimized_times[i] = elapsed_ns
+            outputs.add(tuple(result.output))
             
             # Check if optimization was achieved
             if result.execution_mode == 'optimized':
                 optimized_speedups.append(result.metrics.speedup_factor)
         
         # Performance validation
-        avg_interpreted_time = mean(interpreted_times)
-        avg_optimized_time = mean(optimized_times)
+        avg_interpreted_time = _mean(interpreted_times) / 1e9
+        avg_optimized_time = _mean(optimized_times) / 1e9
         
-        print(f"Average interpreted time: {avg_interpreted_time:.6f}s")
-        print(f"Average optimized time: {avg_optimized_time:.6f}s")
+        log.debug("Average interpreted time: %.6fs", avg_interpreted_time)
+        log.debug("Average optimized time: %.6fs", avg_optimized_time)
         
         # Verify optimization occurred
         if optimized_speedups:
-            avg_speedup = mean(optimized_speedups)
-            print(f"Average simulated speedup: {avg_speedup:.2f}x")
+            avg_speedup = _mean(optimized_speedups)
+            log.debug("Average simulated speedup: %.2fx", avg_speedup)
             assert avg_speedup > 1.0, "Optimized execution should show speedup"
             assert avg_speedup >= 2.0, "Expected at least 2x speedup simulation"
         
         # Verify consistent results
         # All executions should produce the same output
-        interpreted_result = self.pipeline.execute(program)
-        optimized_result = self.pipeline.execute(program)
-        assert interpreted_result.output == optimized_result.output
+        assert len(outputs) == 1, f"Interpreted and optimized outputs differ: {outputs}"
     
-    def test_trust_score_calculation_accuracy(self):
+    @pytest.mark.parametrize("program", _TRUST_PROGRAMS)
+    def test_trust_score_calculation_accuracy(self, pipeline, program):
         """Test accuracy and consistency of trust score calculations."""
-        programs = [
-            "x = 5\nprint x",
-            "y = 10\nz = y * 2\nprint z",
-            "a = 3\nb = 7\nsum = a + b\nprint sum"
-        ]
-        
-        trust_progressions = {}
+        # Execute the program multiple times
+        results = pipeline.execute_many(program, 15)
+        assert all(result.success for result in results)
+        trust_scores = [result.trust_score for result in results]
         
-        for program_id, program in enumerate(programs):
-            trust_scores = []
-            
-            # Execute each program multiple times
-            for execution in range(15):
-                result = self.pipeline.execute(program)
-                assert result.success
-                trust_scores.append(result.trust_score)
-            
-            trust_progressions[program_id] = trust_scores
-            
-            # Validate trust progression
-            assert trust_scores[0] > 0.0, "Initial trust should be positive"
-            assert trust_scores[-1] > trust_scores[0], "Trust should increase over time"
-            
-            # Check for optimization threshold crossing
-            optimization_achieved = any(score >= 1.0 for score in trust_scores)
-            if optimization_achieved:
-                # Find when optimization was first achieved
-                opt_index = next(i for i, score in enumerate(trust_scores) if score >= 1.0)
-                print(f"Program {program_id}: Optimization achieved after {opt_index + 1} executions")
-                assert opt_index >= 5, "Should require multiple executions to reach optimization"
+        # Validate trust progression
+        assert trust_scores[0] > 0.0, "Initial trust should be positive"
+        assert trust_scores[-1] > trust_scores[0], "Trust should increase over time"
         
         # Validate trust score consistency
-        for program_id, scores in trust_progressions.items():
-            # Trust should be monotonically increasing (or stable)
-            for i in range(1, len(scores)):
-                assert scores[i] >= scores[i-1], f"Trust should not decrease: {scores[i]} < {scores[i-1]}"
-            
-            # Trust increment should be reasonable
-            if len(scores) > 1:
-                increments = [scores[i] - scores[i-1] for i in range(1, len(scores))]
-                avg_increment = mean(increments)
-                assert 0.1 <= avg_increment <= 0.5, f"Trust increment should be reasonable: {avg_increment}"
+        # Trust should be monotonically increasing (or stable)
+        for i in range(1, len(trust_scores)):
+            assert trust_scores[i] >= trust_scores[i-1], f"Trust should not decrease: {trust_scores[i]} < {trust_scores[i-1]}"
+        
+        # Check for optimization threshold crossing; scores are sorted, so
+        # the first score >= 1.0 can be found by binary search
+        opt_index = bisect.bisect_left(trust_scores, 1.0)
+        optimization_achieved = opt_index < len(trust_scores)
+        if optimization_achieved:
+            assert opt_index >= 5, "Should require multiple executions to reach optimization"
+        
+        # Trust increment should be reasonable; the step differences
+        # telescope, so their mean is the overall rise over the step count
+        avg_increment = (trust_scores[-1] - trust_scores[0]) / (len(trust_scores) - 1)
+        assert 0.1 <= avg_increment <= 0.5, f"Trust increment should be reasonable: {avg_increment}"
+        
+        if optimization_achieved:
+            log.debug("Optimization achieved after %d executions", opt_index + 1)
     
-    def test_rollback_performance_and_state_consistency(self):
+    def test_rollback_performance_and_state_consistency(self, pipeline):
         """Test rollback performance and state consistency."""
         # Program that will build trust
         safe_program = """
@@ -158,11 +191,9 @@ class TestPerformanceValidation:
         """
         
         # Build trust first
-        trust_scores = []
-        for i in range(12):
-            result = self.pipeline.execute(safe_program)
-            assert result.success
-            trust_scores.append(result.trust_score)
+        results = pipeline.execute_many(safe_program, 12)
+        assert all(result.success for result in results)
+        trust_scores = [result.trust_score for result in results]
         
         # Verify optimization was achieved
         final_trust = trust_scores[-1]
@@ -176,34 +207,38 @@ class TestPerformanceValidation:
         print result
         """
         
-        # Measure rollback performance
-        rollback_times = []
+        # Measure rollback performance; wall time is reported, CPU time is
+        # asserted so contention from other processes can't fail the bound
+        rollback_times = [0] * 3
+        rollback_cpu_times = [0] * 3
         for i in range(3):
-            start_time = time.time()
-            result = self.pipeline.execute(violation_program)
-            end_time = time.time()
+            t0 = time.perf_counter_ns()
+            c0 = time.process_time_ns()
+            result = pipeline.execute(violation_program)
+            rollback_cpu_times[i] = time.process_time_ns() - c0
+            elapsed_ns = time.perf_counter_ns() - t0
             
             assert not result.success
             assert "division by zero" in result.error_message.lower()
-            rollback_times.append(end_time - start_time)
+            rollback_times[i] = elapsed_ns
         
         # Validate rollback performance
-        avg_rollback_time = mean(rollback_times)
-        print(f"Average rollback time: {avg_rollback_time:.6f}s")
+        avg_rollback_time = _mean(rollback_times) / 1e9
         
         # Rollback should be fast (error detection is quick)
-        assert avg_rollback_time < 0.1, "Rollback should be fast"
+        assert _mean(rollback_cpu_times) / 1e9 < 0.1, "Rollback should be fast"
         
         # Verify state consistency after rollback
         # Original safe program should still work but trust may be affected
-        post_rollback_result = self.pipeline.execute(safe_program)
+        post_rollback_result = pipeline.execute(safe_program)
         assert post_rollback_result.success
         assert post_rollback_result.output == ['15']  # Same output as before
         
         # Trust for the safe program should be preserved (different code hash)
         assert post_rollback_result.trust_score >= 1.0, "Safe program trust should be preserved"
+        log.debug("Average rollback time: %.6fs", avg_rollback_time)
     
-    def test_cache_performance_and_efficiency(self):
+    def test_cache_performance_and_efficiency(self, pipeline):
         """Test code cache performance and efficiency."""
         # Program that benefits from caching
         program = """
@@ -217,74 +252,81 @@ class TestPerformanceValidation:
         """
         
         # Build trust to enable optimization
-        for i in range(10):
-            result = self.pipeline.execute(program)
-            assert result.success
+        results = pipeline.execute_many(program, 10)
+        assert all(result.success for result in results)
+        
+        # Warm up the optimizer so neither sample pays first-compile cost
+        results = pipeline.execute_many(program, 2)
+        assert all(result.execution_mode == 'optimized' for result in results)
         
         # Measure cache performance
-        cache_miss_times = []
-        cache_hit_times = []
+        cache_hit_times = [0] * 5
+        
+        # Cache miss: evict the entry so the sample is a pure cache refill
+        code_hash = pipeline.trust_manager.get_code_hash(program)
+        pipeline.cache.clear(code_hash)
+        t0 = time.perf_counter_ns()
+        result1 = pipeline.execute(program)
+        elapsed_ns = time.perf_counter_ns() - t0
         
-        # First execution after optimization (cache miss)
-        start_time = time.time()
-        result1 = self.pipeline.execute(program)
-        end_time = time.time()
+        assert result1.execution_mode == 'optimized'
+        assert not result1.metrics.cache_hit
+        cache_miss_times = [elapsed_ns]
         
-        if result1.execution_mode == 'optimized':
-            cache_miss_times.append(end_time - start_time)
+        # Subsequent executions (cache hits)
+        for i in range(5):
+            t0 = time.perf_counter_ns()
+            result = pipeline.execute(program)
+            elapsed_ns = time.perf_counter_ns() - t0
             
-            # Subsequent executions (cache hits)
-            for i in range(5):
-                start_time = time.time()
-                result = self.pipeline.execute(program)
-                end_time = time.time()
-                
-                assert result.success
-                assert result.execution_mode == 'optimized'
-                cache_hit_times.append(end_time - start_time)
+            assert result.success
+            assert result.execution_mode == 'optimized'
+            assert result.metrics.cache_hit
+            cache_hit_times[i] = elapsed_ns
         
         # Validate cache performance
-        if cache_miss_times and cache_hit_times:
-            avg_miss_time = mean(cache_miss_times)
-            avg_hit_time = mean(cache_hit_times)
-            
-            print(f"Average cache miss time: {avg_miss_time:.6f}s")
-            print(f"Average cache hit time: {avg_hit_time:.6f}s")
-            
-            # Cache hits should be faster than misses (though difference may be small in simulation)
-            # We'll just verify both are reasonable
-            assert avg_miss_time < 0.1, "Cache miss should be reasonably fast"
-            assert avg_hit_time < 0.1, "Cache hit should be reasonably fast"
+        avg_miss_time = _mean(cache_miss_times) / 1e9
+        avg_hit_time = _mean(cache_hit_times) / 1e9
+        
+        log.debug("Average cache miss time: %.6fs", avg_miss_time)
+        log.debug("Average cache hit time: %.6fs", avg_hit_time)
+        
+        # Cache hits should be faster than misses (though difference may be small in simulation)
+        # We'll just verify both are reasonable
+        assert avg_miss_time < 0.1, "Cache miss should be reasonably fast"
+        assert avg_hit_time < 0.1, "Cache hit should be reasonably fast"
     
-    def test_system_scalability_with_multiple_programs(self):
+    def test_system_scalability_with_multiple_programs(self, pipeline):
         """Test system scalability with multiple different programs."""
-        # Generate multiple different programs
-        programs = []
-        for i in range(20):
-            program = f"""
+        # Generate multiple different programs up front, outside the timed loop
+        programs = [
+            f"""
             x{i} = {i + 1}
             y{i} = x{i} * 2
             result{i} = y{i} + {i}
             print result{i}
             """
-            programs.append(program)
+            for i in range(20)
+        ]
         
-        # Measure execution times as we scale up
-        execution_times = []
+        # Measure execution times as we scale up. Each program runs once and
+        # so stays sandboxed: this measures analysis, interpretation and the
+        # growing trust store, not the optimizer's code cache
+        execution_times = [0] * len(programs)
         trust_scores = []
         
         for i, program in enumerate(programs):
-            start_time = time.time()
-            result = self.pipeline.execute(program)
-            end_time = time.time()
+            t0 = time.perf_counter_ns()
+            result = pipeline.execute(program)
+            elapsed_ns = time.perf_counter_ns() - t0
             
             assert result.success
-            execution_times.append(end_time - start_time)
+            execution_times[i] = elapsed_ns
             trust_scores.append(result.trust_score)
         
         # Validate scalability
-        avg_execution_time = mean(execution_times)
-        print(f"Average execution time across {len(programs)} programs: {avg_execution_time:.6f}s")
+        avg_execution_time = _mean(execution_times) / 1e9
+        log.debug("Average execution time across %d programs: %.6fs", len(programs), avg_execution_time)
         
         # Execution time should remain reasonable even with many programs
         assert avg_execution_time < 0.1, "Average execution time should remain reasonable"
@@ -298,78 +340,73 @@ class TestPerformanceValidation:
             early_times = execution_times[:5]
             late_times = execution_times[-5:]
             
-            early_avg = mean(early_times)
-            late_avg = mean(late_times)
+            early_avg = _mean(early_times)
+            late_avg = _mean(late_times)
             
             # Late executions shouldn't be significantly slower
             assert late_avg < early_avg * 3, "System should scale reasonably"
     
-    def test_memory_usage_and_resource_management(self):
+    def test_memory_usage_and_resource_management(self, pipeline):
         """Test memory usage and resource management efficiency."""
         # Execute many programs to test resource management
         programs_executed = 0
         max_programs = 100
         
-        for i in range(max_programs):
-            # Create unique programs to test memory management
-            program = f"""
+        # Create unique programs to test memory management, built before
+        # execution so string formatting stays out of the execution loop
+        programs = [
+            f"""
             var_{i} = {i}
             result_{i} = var_{i} * 2 + 1
             print result_{i}
             """
-            
-            result = self.pipeline.execute(program)
+            for i in range(max_programs)
+        ]
+        
+        for program in programs:
+            result = pipeline.execute(program)
             assert result.success
             programs_executed += 1
         
         # Get system status to check resource usage
-        status = self.pipeline.get_system_status()
+        status = pipeline.get_system_status()
         assert status is not None
         
-        print(f"Executed {programs_executed} programs successfully")
-        
         # Verify system is still responsive after many executions
         test_program = "x = 42\nprint x"
-        final_result = self.pipeline.execute(test_program)
+        final_result = pipeline.execute(test_program)
         assert final_result.success
         assert final_result.output == ['42']
         
-        # System should maintain reasonable performance
-        start_time = time.time()
-        for i in range(5):
-            result = self.pipeline.execute(test_program)
-            assert result.success
-        end_time = time.time()
+        # System should maintain reasonable performance, bounded on CPU time
+        c0 = time.process_time_ns()
+        results = pipeline.execute_many(test_program, 5)
+        cpu_ns = time.process_time_ns() - c0
+        assert all(result.success for result in results)
         
-        avg_time = (end_time - start_time) / 5
+        avg_time = cpu_ns / 5 / 1e9
         assert avg_time < 0.05, "System should remain responsive after many executions"
+        log.debug("Executed %d programs successfully", programs_executed)
     
-    def test_optimization_threshold_accuracy(self):
+    def test_optimization_threshold_accuracy(self, pipeline):
         """Test accuracy of optimization threshold detection."""
         program = "x = 100\ny = x / 4\nprint y"
         
-        execution_modes = []
-        trust_scores = []
-        
         # Execute program many times and track mode transitions
-        for i in range(20):
-            result = self.pipeline.execute(program)
-            assert result.success
-            
-            execution_modes.append(result.execution_mode)
-            trust_scores.append(result.trust_score)
+        results = pipeline.execute_many(program, 20)
+        assert all(result.success for result in results)
         
-        # Find the transition point
-        optimization_start = None
-        for i, mode in enumerate(execution_modes):
-            if mode == 'optimized':
-                optimization_start = i
-                break
+        execution_modes = [result.execution_mode for result in results]
+        trust_scores = [result.trust_score for result in results]
+        
+        # Find the transition point. The mode is chosen before each run's
+        # trust update, so it lags the score and is searched for directly
+        try:
+            optimization_start = execution_modes.index('optimized')
+        except ValueError:
+            optimization_start = None
         
         if optimization_start is not None:
-            print(f"Optimization started at execution {optimization_start + 1}")
-            print(f"Trust score at optimization: {trust_scores[optimization_start]:.2f}")
-            
             # Verify threshold accuracy
             assert trust_scores[optimization_start] >= 1.0, "Should optimize at trust >= 1.0"
             
@@ -381,80 +418,71 @@ class TestPerformanceValidation:
         # Verify trust progression is smooth
         for i in range(1, len(trust_scores)):
             assert trust_scores[i] >= trust_scores[i-1], "Trust should not decrease"
-    
-    def test_error_handling_performance_impact(self):
-        """Test performance impact of error handling."""
-        # Valid program for baseline
-        valid_program = "x = 10\ny = 20\nresult = x + y\nprint result"
-        
-        # Invalid programs that trigger different error types
-        error_programs = [
-            "x = 10 @",  # Lexical error
-            "x = + 10",  # Syntax error
-            "print undefined_var",  # Semantic error
-            "x = 5\ny = 0\nz = x / y"  # Runtime error
-        ]
         
-        # Measure valid execution time
-        valid_times = []
-        for i in range(10):
-            start_time = time.time()
-            result = self.pipeline.execute(valid_program)
-            end_time = time.time()
+        if optimization_start is not None:
+            log.debug("Optimization started at execution %d", optimization_start + 1)
+            log.debug("Trust score at optimization: %.2f", trust_scores[optimization_start])
+    
+    @pytest.mark.parametrize("error_program", [
+        "x = 10 @",  # Lexical error
+        "x = + 10",  # Syntax error
+        "print undefined_var",  # Semantic error
+        "x = 5\ny = 0\nz = x / y"  # Runtime error
+    ], ids=["lexical", "syntax", "semantic", "runtime"])
+    def test_error_handling_performance_impact(self, pipeline, baseline_valid_time, error_program):
+        """Test performance impact of error handling for each error type."""
+        # Measure error handling times; the absolute bound uses CPU time
+        error_times = [0] * 5
+        error_cpu_times = [0] * 5
+        for i in range(5):
+            t0 = time.perf_counter_ns()
+            c0 = time.process_time_ns()
+            result = pipeline.execute(error_program)
+            error_cpu_times[i] = time.process_time_ns() - c0
+            elapsed_ns = time.perf_counter_ns() - t0
             
-            assert result.success
-            valid_times.append(end_time - start_time)
-        
-        avg_valid_time = mean(valid_times)
-        
-        # Measure error handling times
-        error_times = []
-        for error_program in error_programs:
-            for i in range(5):
-                start_time = time.time()
-                result = self.pipeline.execute(error_program)
-                end_time = time.time()
-                
-                assert not result.success  # Should fail
-                error_times.append(end_time - start_time)
+            assert not result.success  # Should fail
+            error_times[i] = elapsed_ns
         
-        avg_error_time = mean(error_times)
+        avg_error_time = _mean(error_times) / 1e9
         
-        print(f"Average valid execution time: {avg_valid_time:.6f}s")
-        print(f"Average error handling time: {avg_error_time:.6f}s")
+        log.debug("Average valid execution time: %.6fs", baseline_valid_time)
+        log.debug("Average error handling time: %.6fs", avg_error_time)
         
         # Error handling should be fast
-        assert avg_error_time < 0.05, "Error handling should be fast"
+        assert _mean(error_cpu_times) / 1e9 < 0.05, "Error handling should be fast"
         
         # Error handling shouldn't be significantly slower than valid execution
-        assert avg_error_time < avg_valid_time * 5, "Error handling shouldn't be much slower than valid execution"
+        assert avg_error_time < baseline_valid_time * 5, "Error handling shouldn't be much slower than valid execution"
         
         # System should recover quickly from errors
-        recovery_result = self.pipeline.execute(valid_program)
+        recovery_result = pipeline.execute(_VALID_PROGRAM)
         assert recovery_result.success, "System should recover quickly from errors"
 
 
 if __name__ == "__main__":
     # Run a quick performance test
     test_instance = TestPerformanceValidation()
-    test_instance.setup_method()
+    temp_dir = tempfile.TemporaryDirectory()
+    pipeline = AegisExecutionPipeline(trust_file=os.path.join(temp_dir.name, "trust.json"))
     
     try:
         print("Running performance validation tests...")
         
         # Test basic performance
-        test_instance.test_interpreter_vs_optimized_execution_performance()
+        test_instance.test_interpreter_vs_optimized_execution_performance(pipeline)
         print("✓ Interpreter vs optimized performance test passed")
         
         # Test trust calculation
-        test_instance.test_trust_score_calculation_accuracy()
+        for program in _TRUST_PROGRAMS:
+            test_instance.test_trust_score_calculation_accuracy(pipeline, program)
         print("✓ Trust score calculation test passed")
         
         # Test optimization threshold
-        test_instance.test_optimization_threshold_accuracy()
+        test_instance.test_optimization_threshold_accuracy(pipeline)
         print("✓ Optimization threshold test passed")
         
         print("\nAll performance validation tests passed!")
         
     finally:
-        test_instance.teardown_method()
\ No newline at end of file
+        temp_dir.cleanup()
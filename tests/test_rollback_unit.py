@@ -9,37 +9,55 @@ import pytest
 from datetime import datetime
 from aegis.runtime.rollback import RollbackHandler, RollbackEvent
 from aegis.runtime.monitor import RuntimeMonitor, SecurityViolation, ExecutionMetrics
-from aegis.trust.trust_manager import TrustManager, TrustScore
+from aegis.trust.trust_manager import MEMORY_TRUST_FILE, TrustManager, TrustScore
 from aegis.interpreter.context import ExecutionContext
 from aegis.compiler.cache import CodeCache
 from aegis.compiler.optimizer import OptimizedExecutor
 
 
+@pytest.fixture(scope="module")
+def rollback_components():
+    """
+    Wired-up rollback components built once for the whole module.
+    
+    Returns (rollback_handler, monitor, trust_manager, cache, optimizer).
+    Trust is kept in memory, so no trust file is created.
+    """
+    rollback_handler = RollbackHandler()
+    monitor = RuntimeMonitor()
+    trust_manager = TrustManager(trust_file=MEMORY_TRUST_FILE)
+    cache = CodeCache()
+    optimizer = OptimizedExecutor(cache, monitor)
+    
+    # Set up integration
+    optimizer.set_rollback_handler(rollback_handler)
+    rollback_handler.register_trust_update_callback(
+        trust_manager.revoke_trust_for_violation
+    )
+    rollback_handler.register_cache_clear_callback(
+        optimizer.clear_cache
+    )
+    
+    return rollback_handler, monitor, trust_manager, cache, optimizer
+
+
 class TestRollbackUnit:
     """Unit tests for rollback system functionality."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.rollback_handler = RollbackHandler()
-        self.monitor = RuntimeMonitor()
-        self.trust_manager = TrustManager(trust_file=".test_trust.json")
-        self.cache = CodeCache()
-        self.optimizer = OptimizedExecutor(self.cache, self.monitor)
-        
-        # Set up integration
-        self.optimizer.set_rollback_handler(self.rollback_handler)
-        self.rollback_handler.register_trust_update_callback(
-            self.trust_manager.revoke_trust_for_violation
-        )
-        self.rollback_handler.register_cache_clear_callback(
-            self.optimizer.clear_cache
-        )
-    
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import os
-        if os.path.exists(".test_trust.json"):
-            os.remove(".test_trust.json")
+    @pytest.fixture(autouse=True)
+    def setup_components(self, rollback_components):
+        """Hand out the shared components, reset to a freshly built state."""
+        (self.rollback_handler, self.monitor, self.trust_manager,
+         self.cache, self.optimizer) = rollback_components
+        
+        self.rollback_handler.reset()
+        self.trust_manager.clear()
+        self.cache.clear_all()
+        
+        # Restore the default configuration changed by earlier tests
+        self.rollback_handler.max_rollback_history = 100
+        self.rollback_handler.rollback_enabled = True
+        self.rollback_handler.auto_trust_revocation = True
     
     def test_basic_rollback_event_creation(self):
         """Test basic rollback event creation."""
@@ -255,7 +273,126 @@ class TestRollbackUnit:
             expected_index = 2 + i  # Should keep events 2, 3, 4
             assert event.details == f'Violation {expected_index}'
         
+        # Filtered queries should only see the events still in history
+        assert self.rollback_handler.get_rollback_history(code_hash='code0') == []
+        assert self.rollback_handler.get_rollback_history(
+            violation_type='instruction_limit'
+        ) == list(history)
+        
         # Test history cleanup
         cleared_count = self.rollback_handler.clear_rollback_history()
         assert cleared_count == 3
-        assert len(self.rollback_handler.rollback_history) == 0
\ No newline at end of file
+        assert len(self.rollback_handler.rollback_history) == 0
+    
+    def test_rollback_batch_records_rollbacks_before_failure(self):
+        """Test that a failing batch entry keeps the rollbacks already performed."""
+        notified = []
+        self.rollback_handler.register_rollback_callback(notified.append)
+        try:
+            with pytest.raises(TypeError):
+                self.rollback_handler.trigger_rollback_batch([
+                    {'violation_type': 'instruction_limit', 'code_hash': 'code0', 'details': 'First'},
+                    {'violation_type': 'memory_limit', 'code_hash': 'code1'}
+                ])
+        finally:
+            self.rollback_handler.rollback_callbacks.remove(notified.append)
+        
+        history = list(self.rollback_handler.rollback_history)
+        assert [event.code_hash for event in history] == ['code0']
+        assert notified == history
+        assert self.rollback_handler.get_rollback_statistics()['total_rollbacks'] == 1
+    
+    def test_rollback_with_zero_history_size(self):
+        """Test that rollbacks still work when no history is kept."""
+        self.rollback_handler.max_rollback_history = 0
+        
+        event = self.rollback_handler.trigger_rollback(
+            violation_type='instruction_limit',
+            code_hash='code0',
+            details='Violation 0',
+            context=ExecutionContext(),
+            trust_score_before=1.0
+        )
+        events = self.rollback_handler.trigger_rollback_batch([
+            {'violation_type': 'memory_limit', 'code_hash': 'code1', 'details': 'Violation 1'}
+        ])
+        
+        assert event is not None
+        assert len(events) == 1
+        assert len(self.rollback_handler.rollback_history) == 0
+        assert self.rollback_handler.get_rollback_history(code_hash='code0') == []
+        assert self.rollback_handler.get_rollback_history(violation_type='memory_limit') == []
+        
+        stats = self.rollback_handler.get_rollback_statistics()
+        assert stats['total_rollbacks'] == 2
+        assert stats['history_size'] == 0
+    
+    def test_clear_old_rollback_history(self):
+        """Test that only events older than the cutoff are cleared."""
+        for i in range(2):
+            self.rollback_handler.trigger_rollback(
+                violation_type='instruction_limit',
+                code_hash=f'code{i}',
+                details=f'Violation {i}',
+                context=ExecutionContext(),
+                trust_score_before=1.0
+            )
+        
+        # Age the first event by ten days
+        old_event, recent_event = self.rollback_handler.rollback_history
+        old_event.timestamp_ns -= 10 * 24 * 60 * 60 * 10**9
+        assert (datetime.now() - old_event.timestamp).days == 10
+        
+        assert self.rollback_handler.get_rollback_statistics()['recent_rollbacks'] == 1
+        
+        cleared_count = self.rollback_handler.clear_rollback_history(older_than_days=7)
+        assert cleared_count == 1
+        assert list(self.rollback_handler.rollback_history) == [recent_event]
+        assert self.rollback_handler.get_rollback_history(code_hash='code0') == []
+    
+    def test_rollback_handler_reset(self):
+        """Test that reset clears history and statistics but keeps wiring."""
+        self.rollback_handler.set_auto_trust_revocation(False)
+        self.rollback_handler.trigger_rollback(
+            violation_type='instruction_limit',
+            code_hash='reset1234567890a',
+            details='Violation before reset',
+            context=ExecutionContext(),
+            trust_score_before=1.0
+        )
+        
+        self.rollback_handler.reset()
+        
+        stats = self.rollback_handler.get_rollback_statistics()
+        assert stats['total_rollbacks'] == 0
+        assert stats['rollbacks_by_type'] == {}
+        assert stats['rollbacks_by_code'] == {}
+        assert stats['history_size'] == 0
+        
+        # Configuration and callbacks survive the reset
+        assert self.rollback_handler.auto_trust_revocation == False
+        assert self.rollback_handler.trust_update_callback is not None
+        assert self.rollback_handler.cache_clear_callback is not None
+    
+    def test_rollback_batch(self):
+        """Test that batch rollbacks are recorded like individual rollbacks."""
+        rollbacks = [
+            {'violation_type': 'instruction_limit', 'code_hash': 'code0', 'details': 'Violation 0'},
+            {'violation_type': 'memory_limit', 'code_hash': 'code1', 'details': 'Violation 1'},
+            {'violation_type': 'instruction_limit', 'code_hash': 'code0', 'details': 'Violation 2'}
+        ]
+        
+        events = self.rollback_handler.trigger_rollback_batch(rollbacks)
+        
+        assert [event.details for event in events] == ['Violation 0', 'Violation 1', 'Violation 2']
+        assert list(self.rollback_handler.rollback_history) == events
+        
+        stats = self.rollback_handler.get_rollback_statistics()
+        assert stats['total_rollbacks'] == 3
+        assert stats['rollbacks_by_type'] == {'instruction_limit': 2, 'memory_limit': 1}
+        assert stats['rollbacks_by_code'] == {'code0': 2, 'code1': 1}
+        
+        # Disabled rollback ignores the whole batch
+        self.rollback_handler.enable_rollback(False)
+        assert self.rollback_handler.trigger_rollback_batch(rollbacks) == []
+        assert self.rollback_handler.total_rollbacks == 3
\ No newline at end of file
@@ -5,13 +5,13 @@ These tests validate that the runtime monitor correctly tracks execution
 behavior and detects security violations across all possible program inputs.
 """
 
+from dataclasses import replace
+
 import pytest
 from hypothesis import given, strategies as st, assume, settings
-from aegis.lexer.lexer import Lexer
-from aegis.parser.parser import Parser
 from aegis.interpreter.interpreter import SandboxedInterpreter
 from aegis.interpreter.context import ExecutionContext
-from aegis.runtime.monitor import RuntimeMonitor, SecurityViolation
+from aegis.runtime.monitor import ExecutionMetrics, RuntimeMonitor, SecurityViolation
 
 
 class TestRuntimeMonitorProperties:
@@ -19,14 +19,12 @@ class TestRuntimeMonitorProperties:
     
     def setup_method(self):
         """Set up test fixtures."""
-        self.lexer = Lexer()
-        self.parser = Parser()
         self.monitor = RuntimeMonitor()
         self.interpreter = SandboxedInterpreter(self.monitor)
     
     @given(st.lists(st.integers(min_value=-1000, max_value=1000), min_size=1, max_size=5))
     @settings(max_examples=50)
-    def test_runtime_monitoring_completeness(self, values):
+    def test_runtime_monitoring_completeness(self, parsed, values):
         """
         **Feature: aegis, Property 11: Runtime Monitoring Completeness**
         
@@ -63,8 +61,10 @@ class TestRuntimeMonitorProperties:
         
         # Execute the program with monitoring
         try:
-            tokens = self.lexer.tokenize(source_code)
-            ast = self.parser.parse(tokens)
+            # The session-wide parsed fixture memoizes tokenize+parse, so
+            # inputs replayed while shrinking skip the front end; the
+            # interpreter only reads the shared AST
+            _, ast = parsed(source_code)
             context = ExecutionContext()
             
             # Execute with monitoring
@@ -99,7 +99,7 @@ class TestRuntimeMonitorProperties:
     
     @given(st.integers(min_value=1, max_value=100))
     @settings(max_examples=30)
-    def test_violation_detection_completeness(self, operation_count):
+    def test_violation_detection_completeness(self, parsed, operation_count):
         """
         **Feature: aegis, Property 11a: Violation Detection Completeness**
         
@@ -118,8 +118,7 @@ class TestRuntimeMonitorProperties:
         source_code = "\n".join(program_lines)
         
         try:
-            tokens = self.lexer.tokenize(source_code)
-            ast = self.parser.parse(tokens)
+            _, ast = parsed(source_code)
             context = ExecutionContext()
             
             # This should trigger a violation
@@ -142,7 +141,7 @@ class TestRuntimeMonitorProperties:
     @given(st.lists(st.text(alphabet="abcdefghijklmnopqrstuvwxyz", min_size=1, max_size=8), 
                    min_size=1, max_size=5))
     @settings(max_examples=30)
-    def test_variable_access_tracking_completeness(self, var_names):
+    def test_variable_access_tracking_completeness(self, parsed, var_names):
         """
         **Feature: aegis, Property 11b: Variable Access Tracking Completeness**
         
@@ -177,8 +176,7 @@ class TestRuntimeMonitorProperties:
         source_code = "\n".join(program_lines)
         
         try:
-            tokens = self.lexer.tokenize(source_code)
-            ast = self.parser.parse(tokens)
+            _, ast = parsed(source_code)
             context = ExecutionContext()
             
             self.interpreter.execute(ast, context)
@@ -203,7 +201,7 @@ class TestRuntimeMonitorProperties:
     @given(st.integers(min_value=0, max_value=100), 
            st.integers(min_value=1, max_value=100))
     @settings(max_examples=30)
-    def test_arithmetic_operation_monitoring_completeness(self, left, right):
+    def test_arithmetic_operation_monitoring_completeness(self, parsed, left, right):
         """
         **Feature: aegis, Property 11c: Arithmetic Operation Monitoring Completeness**
         
@@ -215,44 +213,42 @@ class TestRuntimeMonitorProperties:
         # to avoid parser issues with negative literals
         operations = ['+', '-', '*', '/']
         
+        # Parse the program once and swap in each operator; the nodes are
+        # only read by the interpreter, so the variants share the rest
+        _, template = parsed(f"x = {left}\ny = {right}\nresult = x + y\nprint result")
+        assign_x, assign_y, assign_result, print_result = template
+        
         for op in operations:
-            program = f"x = {left}\ny = {right}\nresult = x {op} y\nprint result"
+            ast = [
+                assign_x,
+                assign_y,
+                replace(assign_result, expression=replace(assign_result.expression, operator=op)),
+                print_result
+            ]
             
             try:
-                tokens = self.lexer.tokenize(program)
-                ast = self.parser.parse(tokens)
                 context = ExecutionContext()
                 
                 # Reset monitor for each operation
-                self.monitor = RuntimeMonitor()
-                self.interpreter.set_runtime_monitor(self.monitor)
+                self.monitor.reset()
                 
                 self.interpreter.execute(ast, context)
                 
-                # Verify arithmetic operation was tracked
-                metrics = self.monitor.get_metrics()
+                # Verify arithmetic operation was tracked in the archived metrics
+                metrics = self.monitor.get_execution_history()[-1]
                 assert metrics.arithmetic_operations >= 1, \
                     f"Arithmetic operation {op} should be tracked"
                 
-                # Verify operation details are recorded
-                op_found = False
-                for operation in metrics.operations_performed:
-                    if "arithmetic" in operation and op in operation:
-                        op_found = True
-                        break
-                
-                assert op_found, f"Arithmetic operation {op} should be recorded in operations"
+                # Verify the operator is recorded
+                assert metrics.arithmetic_operators == {op: 1}, \
+                    f"Arithmetic operation {op} should be recorded by operator"
                 
             except SecurityViolation:
                 # Overflow violations are valid monitoring behavior
                 metrics = self.monitor.get_metrics()
                 assert len(metrics.violations_detected) > 0, "Violation should be recorded"
-            except Exception as e:
-                # Other exceptions might occur (like parse errors), but we should
-                # still verify the monitor was at least initialized
-                pass  # Skip this iteration if parsing fails
     
-    def test_monitor_state_consistency(self):
+    def test_monitor_state_consistency(self, parsed):
         """
         **Feature: aegis, Property 11d: Monitor State Consistency**
         
@@ -271,19 +267,17 @@ class TestRuntimeMonitorProperties:
         total_instructions = 0
         
         for program in programs:
-            tokens = self.lexer.tokenize(program)
-            ast = self.parser.parse(tokens)
+            _, ast = parsed(program)
             context = ExecutionContext()
             
             # Start fresh monitoring for each program
-            self.monitor = RuntimeMonitor()
-            self.interpreter.set_runtime_monitor(self.monitor)
+            self.monitor.reset()
             
             self.interpreter.execute(ast, context)
             
             # Get metrics from execution history (most recent execution)
             history = self.monitor.get_execution_history()
-            assert len(history) > 0, "Execution should be recorded in history"
+            assert len(history) == 1, "Only this execution should be recorded since the reset"
             
             metrics = history[-1]  # Get the most recent execution
             
@@ -306,4 +300,13 @@ class TestRuntimeMonitorProperties:
         
         # Verify we executed all programs
         assert execution_count == len(programs), "All programs should have been executed"
-        assert total_instructions > 0, "Total instructions should be positive"
\ No newline at end of file
+        assert total_instructions > 0, "Total instructions should be positive"
+    
+    def test_variable_access_deduplicates_initial_variables(self):
+        """Variables passed to ExecutionMetrics are not recorded twice."""
+        metrics = ExecutionMetrics(variables_accessed=['x'])
+        
+        metrics.add_variable_access('x')
+        metrics.add_variable_access('y')
+        
+        assert metrics.variables_accessed == ['x', 'y']
@@ -9,7 +9,7 @@ import pytest
 import tempfile
 import os
 from datetime import datetime, timedelta
-from aegis.trust.trust_manager import TrustManager, TrustScore
+from aegis.trust.trust_manager import MEMORY_TRUST_FILE, TrustManager, TrustScore
 from aegis.trust.trust_policy import TrustPolicy
 from aegis.runtime.monitor import ExecutionMetrics, SecurityViolation
 from aegis.interpreter.context import ExecutionContext
@@ -354,6 +354,51 @@ class TestTrustManager:
         loaded_score = new_trust_manager.get_trust_score(code_hash).current_score
         assert loaded_score == original_score
     
+    def test_memory_trust_store_is_not_persisted(self, tmp_path, monkeypatch):
+        """In-memory trust data is kept per manager and never written to disk."""
+        monkeypatch.chdir(tmp_path)
+        
+        trust_manager = TrustManager(trust_file=MEMORY_TRUST_FILE)
+        metrics = ExecutionMetrics()
+        trust_manager.update_trust("memory_test", metrics, [])
+        
+        assert trust_manager.get_trust_score("memory_test").execution_count == 1
+        assert list(tmp_path.iterdir()) == [], "Memory trust store should not touch the filesystem"
+        
+        # A second manager starts empty rather than sharing the first one's data
+        new_trust_manager = TrustManager(trust_file=MEMORY_TRUST_FILE)
+        assert new_trust_manager.get_trust_score("memory_test").execution_count == 0
+    
+    def test_clear_persisted_on_flush(self):
+        """Test that clearing trust scores is written on flush."""
+        self.trust_manager.update_trust("test123", ExecutionMetrics(), [])
+        
+        self.trust_manager.clear()
+        self.trust_manager.flush()
+        
+        reloaded = TrustManager(trust_file=self.temp_file.name)
+        assert reloaded.trust_scores == {}
+    
+    def test_violation_revocation_persisted_on_flush(self):
+        """Test that violation revocations are written on flush, not immediately."""
+        code_hash = "test123"
+        metrics = ExecutionMetrics()
+        
+        for _ in range(3):
+            self.trust_manager.update_trust(code_hash, metrics, [])
+        original_score = self.trust_manager.get_trust_score(code_hash).current_score
+        
+        # Revocation updates memory but defers the write
+        self.trust_manager.revoke_trust_for_violation(code_hash, "instruction_limit", "Test")
+        assert self.trust_manager.get_trust_score(code_hash).current_score == 0.0
+        stale_score = TrustManager(trust_file=self.temp_file.name).get_trust_score(code_hash).current_score
+        assert stale_score == original_score
+        
+        # Flushing persists the revocation
+        self.trust_manager.flush()
+        flushed_score = TrustManager(trust_file=self.temp_file.name).get_trust_score(code_hash).current_score
+        assert flushed_score == 0.0
+    
     def test_cleanup_old_trust_data(self):
         """Test cleanup of old trust data."""
         metrics = ExecutionMetrics()